@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
+import orjson
 import requests
 
 from fpmcp.http import get_session
@@ -11,6 +14,17 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
     from typing import Any
 
+# DOI: '10.' + registrant code + '/' + suffix (ISO 26324), optionally prefixed
+# with "doi:" or a doi.org resolver URL
+_DOI_RE = re.compile(r"^(?:doi:|https?://doi\.org/)?\s*10\.\d+/.+")
+
+# PMCID: 'PMC' + digits, optionally '.digits' for version
+_PMCID_RE = re.compile(r"^PMC\d+(?:\.\d+)?$")
+
+IDCONV_URL = "https://pmc.ncbi.nlm.nih.gov/tools/idconv/api/v1/articles/"
+# Maximum number of IDs the PMC ID converter accepts per request
+IDCONV_BATCH_SIZE = 200
+
 
 class ArticleIdentifier:
     """Hybrid identifier system that normalizes to DOI but preserves other IDs
@@ -22,8 +36,57 @@ class ArticleIdentifier:
     """
 
     def __init__(self, identifier: Any) -> None:
+        self._detect(identifier)
+        if self.pmcid or self.doi or self.pmid:
+            self._complete_identifiers()
+
+    @classmethod
+    def bulk(cls, identifiers: Iterable[Any]) -> list[ArticleIdentifier]:
+        """Create identifiers for many articles with batched API lookups.
+
+        Equivalent to ``[ArticleIdentifier(i) for i in identifiers]``, but
+        identifiers of the same type are completed with one PMC ID converter
+        request per batch of up to `IDCONV_BATCH_SIZE` IDs, rather than one
+        request each.  Identifiers the converter can't complete fall back to
+        individual Europe PMC lookups.
+
+        Parameters
+        ----------
+        identifiers : Iterable[Any]
+            Article identifiers: DOIs, PMIDs, or PMCIDs (may be mixed)
+
+        Returns
+        -------
+        list[ArticleIdentifier]
+            One identifier per input, in input order.
+        """
+        articles: list[ArticleIdentifier] = []
+        by_type: dict[str, list[ArticleIdentifier]] = defaultdict(list)
+        for identifier in identifiers:
+            article = cls.__new__(cls)
+            article._detect(identifier)
+            articles.append(article)
+            if article.pmcid or article.doi or article.pmid:
+                by_type[article._idtype()].append(article)
+
+        for idtype, group in by_type.items():
+            for i in range(0, len(group), IDCONV_BATCH_SIZE):
+                batch = group[i : i + IDCONV_BATCH_SIZE]
+                id_values = [getattr(article, idtype) for article in batch]
+                records = _idconv_records(id_values, idtype)
+                for article, id_value in zip(batch, id_values, strict=True):
+                    record = records.get(_idconv_key(id_value, idtype))
+                    if not (record and article._update_from_record(record)):
+                        article._try_europe_pmc(id_value, idtype)
+
+        return articles
+
+    def _detect(self, identifier: Any) -> None:
+        """Set source_id and whichever identifier it looks like."""
         self.doi = self.pmid = self.pmcid = None
-        self.source_id = identifier = str(identifier)
+        # identifiers are interned so that duplicates across many instances
+        # (e.g. one DOI cited for several proteins) share a single string
+        self.source_id = identifier = sys.intern(str(identifier))
 
         if _is_pmcid(identifier):
             self.pmcid = identifier
@@ -32,8 +95,8 @@ class ArticleIdentifier:
         elif _is_pmid(identifier):
             self.pmid = identifier
 
-        if self.pmcid or self.doi or self.pmid:
-            self._complete_identifiers()
+    def _idtype(self) -> str:
+        return "doi" if self.doi else "pmid" if self.pmid else "pmcid"
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, ArticleIdentifier):
@@ -90,44 +153,30 @@ class ArticleIdentifier:
         if not (id_value := self.doi or self.pmid or self.pmcid):
             return False
 
-        idtype = "doi" if self.doi else "pmid" if self.pmid else "pmcid"
+        idtype = self._idtype()
         return self._try_pmc_converter(id_value, idtype) or self._try_europe_pmc(
             id_value, idtype
         )
 
     def _try_pmc_converter(self, id_value: str, idtype: str) -> bool:
-        try:
-            response = get_session().get(
-                "https://pmc.ncbi.nlm.nih.gov/tools/idconv/api/v1/articles/",
-                params={
-                    "ids": id_value,
-                    "idtype": idtype,
-                    "format": "json",
-                    "tool": "fpmcp",
-                    "email": "research@example.com",
-                },
-                timeout=10,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get("status") == "ok" and data.get("records"):
-                record = data["records"][0]
-                if record.get("status") == "error":
-                    return False
-
-                if not self.doi and record.get("doi"):
-                    self.doi = record["doi"]
-                if not self.pmid and record.get("pmid"):
-                    self.pmid = str(record["pmid"])
-                if not self.pmcid and record.get("pmcid"):
-                    self.pmcid = record["pmcid"]
-                return True
-
-        except (requests.RequestException, KeyError, ValueError):
-            pass
+        # a single-ID request returns at most one record
+        if records := _idconv_records([id_value], idtype):
+            return self._update_from_record(next(iter(records.values())))
         return False
 
+    def _update_from_record(self, record: dict[str, Any]) -> bool:
+        """Fill in missing identifiers from a PMC ID converter record."""
+        if record.get("status") == "error":
+            return False
+
+        if not self.doi and record.get("doi"):
+            self.doi = sys.intern(record["doi"])
+        if not self.pmid and record.get("pmid"):
+            self.pmid = sys.intern(str(record["pmid"]))
+        if not self.pmcid and record.get("pmcid"):
+            self.pmcid = sys.intern(record["pmcid"])
+        return True
+
     def _try_europe_pmc(self, id_value: str, idtype: str) -> bool:
         query = (
             id_value
@@ -146,16 +195,16 @@ class ArticleIdentifier:
                 timeout=10,
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get("hitCount", 0) > 0 and data.get("resultList", {}).get("result"):
                 result = data["resultList"]["result"][0]
                 if not self.doi and result.get("doi"):
-                    self.doi = result["doi"]
+                    self.doi = sys.intern(result["doi"])
                 if not self.pmid and result.get("pmid"):
-                    self.pmid = result["pmid"]
+                    self.pmid = sys.intern(result["pmid"])
                 if not self.pmcid and result.get("pmcid"):
-                    self.pmcid = result["pmcid"]
+                    self.pmcid = sys.intern(result["pmcid"])
                 return True
 
         except (requests.RequestException, KeyError, ValueError):
@@ -163,6 +212,58 @@ class ArticleIdentifier:
         return False
 
 
+def _idconv_key(id_value: str, idtype: str) -> str:
+    # DOIs are case-insensitive, and the converter may echo them differently
+    return id_value.lower() if idtype == "doi" else id_value
+
+
+def _idconv_records(id_values: list[str], idtype: str) -> dict[str, dict[str, Any]]:
+    """Look up IDs with the PMC ID converter, returning records by requested ID.
+
+    Records for IDs the converter doesn't know carry ``status: "error"``.  An
+    empty dict is returned if the request fails.  Records are matched to the
+    requested IDs by their ``requested-id``, except for a single ID, which is
+    matched to the only record returned.
+
+    Sources
+    -------
+    - PMC ID Converter API: https://pmc.ncbi.nlm.nih.gov/tools/id-converter-api/
+    """
+    try:
+        response = get_session().get(
+            IDCONV_URL,
+            params={
+                "ids": ",".join(id_values),
+                "idtype": idtype,
+                "format": "json",
+                "tool": "fpmcp",
+                "email": "research@example.com",
+            },
+            timeout=10,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+    except (requests.RequestException, ValueError):
+        return {}
+
+    if data.get("status") != "ok":
+        return {}
+
+    if len(id_values) == 1:
+        # the only record is for the only ID, whatever form the converter
+        # echoes it back in (e.g. a differently prefixed DOI)
+        if records := data.get("records"):
+            return {_idconv_key(id_values[0], idtype): records[0]}
+        return {}
+
+    records: dict[str, dict[str, Any]] = {}
+    for record in data.get("records") or []:
+        requested = record.get("requested-id") or record.get(idtype)
+        if requested is not None:
+            records[_idconv_key(str(requested), idtype)] = record
+    return records
+
+
 def _is_doi(identifier: str) -> bool:
     """Check if identifier is a DOI.
 
@@ -173,12 +274,7 @@ def _is_doi(identifier: str) -> bool:
     -------
     - DataCite DOI Basics: https://support.datacite.org/docs/doi-basics
     """
-    id_clean = identifier.strip()
-    for prefix in ("doi:", "https://doi.org/", "http://doi.org/"):
-        if id_clean.startswith(prefix):
-            id_clean = id_clean[len(prefix) :].strip()
-            break
-    return bool(re.match(r"^10\.\d+/.+", id_clean))
+    return bool(_DOI_RE.match(identifier.strip()))
 
 
 def _is_pmid(identifier: str) -> bool:
@@ -209,5 +305,4 @@ def _is_pmcid(identifier: str) -> bool:
     - PMC ID Converter: https://pmc.ncbi.nlm.nih.gov/tools/idconv/
     - Bioregistry PMCID: https://bioregistry.io/pmc
     """
-    # PMCID format: PMC followed by digits, optionally .digits for version
-    return bool(re.match(r"^PMC\d+(?:\.\d+)?$", identifier.strip()))
+    return bool(_PMCID_RE.match(identifier.strip()))
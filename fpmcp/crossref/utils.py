@@ -1,29 +1,44 @@
+from functools import lru_cache
+
+import orjson
+import requests
+
 from fpmcp.http import get_session
 
 
 def get_fulltext_urls_from_crossref(doi: str) -> dict:
     """Use CrossRef to find full-text links for any DOI
 
-    Returns: dict with PDF/XML URLs and license info
+    Returns: dict with PDF/XML URLs and license info, or an empty dict if
+    CrossRef has no record of the DOI.  Successful lookups are kept in memory
+    (failures are retried), and each call returns a new dict.
     """
-    url = f"https://api.crossref.org/works/{doi}"
-    response = get_session().get(url)
-
-    if response.status_code == 200:
-        data = response.json()["message"]
+    # DOIs are case-insensitive, so normalize them for better cache hits
+    try:
+        urls = _get_fulltext_urls(doi.strip().lower())
+    except requests.HTTPError:
+        return {}
+    return {**urls, "licenses": list(urls["licenses"])}
 
-        # Extract full-text links
-        links = data.get("link", [])
-        fulltext_urls = {link["content-type"]: link["URL"] for link in links}
 
-        # Extract license
-        licenses = data.get("license", [])
-
-        return {
-            "pdf_url": fulltext_urls.get("application/pdf"),
-            "xml_url": fulltext_urls.get("application/xml"),
-            "html_url": fulltext_urls.get("text/html"),
-            "licenses": [lic["URL"] for lic in licenses],
-        }
-
-    return {}
+@lru_cache(maxsize=512)
+def _get_fulltext_urls(doi: str) -> dict:
+    url = f"https://api.crossref.org/works/{doi}"
+    response = get_session().get(url)
+    response.raise_for_status()
+    data = orjson.loads(response.content)["message"]
+
+    # Extract full-text links
+    links = data.get("link", [])
+    fulltext_urls = {link["content-type"]: link["URL"] for link in links}
+
+    # Extract license
+    licenses = data.get("license", [])
+
+    return {
+        "pdf_url": fulltext_urls.get("application/pdf"),
+        "xml_url": fulltext_urls.get("application/xml"),
+        "html_url": fulltext_urls.get("text/html"),
+        # a tuple, so the cached value can't be modified through a result
+        "licenses": tuple(lic["URL"] for lic in licenses),
+    }
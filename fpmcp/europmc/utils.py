@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Final
 
 from fpmcp.europmc.models import Model as SearchResponse
@@ -7,6 +8,7 @@ from fpmcp.http import get_session
 ROOT: Final = "https://www.ebi.ac.uk/europepmc/webservices/rest"
 
 
+@lru_cache(maxsize=512)
 def _search(query: str) -> SearchResponse:
     # https://europepmc.org/RestfulWebService#!/Europe32PMC32Articles32RESTful32API/search
     response = get_session().get(
@@ -14,14 +16,16 @@ def _search(query: str) -> SearchResponse:
         params={"query": query, "format": "json", "resultType": "core"},
     )
     response.raise_for_status()
-    return SearchResponse.model_validate_json(response.text)
+    return SearchResponse.model_validate_json(response.content)
 
 
-def _fulltext_xml(pmcid: str) -> str | None:
+def _fulltext_xml(pmcid: str) -> bytes | None:
     # https://europepmc.org/RestfulWebService#!/Europe32PMC32Articles32RESTful32API/fullTextXML
+    # Returned undecoded: the XML parser reads the document's own encoding, and
+    # requests would otherwise sniff the charset of the whole (MB-sized) body.
     xml_response = get_session().get(f"{ROOT}/{pmcid}/fullTextXML")
     if xml_response.status_code == 200:
-        return xml_response.text
+        return xml_response.content
     return None
 
 
@@ -34,6 +38,8 @@ def get_fulltext_from_europmc(pmid: str) -> str | None:
     # Check if full text available
     article = result[0]
     if article.inEPMC == "Y" and (pmcid := article.pmcid):
-        return _fulltext_xml(pmcid)
+        if (xml := _fulltext_xml(pmcid)) is not None:
+            # Europe PMC serves JATS as UTF-8
+            return xml.decode("utf-8")
 
     return None
@@ -3,8 +3,11 @@
 from collections import defaultdict
 from collections.abc import Mapping
 from functools import cache
+from types import MappingProxyType
 
-import requests
+import orjson
+
+from fpmcp.http import get_session
 
 URL = "https://www.fpbase.org/graphql/"
 GET_REFS = """{
@@ -20,48 +23,84 @@ GET_REFS = """{
 @cache
 def get_references() -> list[dict]:
     """Fetch all PMIDs from FPbase GraphQL API, and their associated proteins"""
-    requests_session = requests.Session()
-    response = requests_session.post(URL, json={"query": GET_REFS})
+    response = get_session().post(URL, json={"query": GET_REFS})
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
     if "errors" in data:
         raise RuntimeError(f"GraphQL query failed: {data['errors']}")
     return data["data"]["references"]
 
 
-def pmids() -> Mapping[str, list[str]]:
-    """Get mapping of PMIDs to associated protein IDs."""
-    refs = get_references()
-    pmid_map: dict[str, list[str]] = {}
-    for ref in refs:
-        pmid = ref.get("pmid")
-        if not pmid:
-            continue
-        proteins = [edge["node"] for edge in ref["proteins"]["edges"]]
-        pmid_map[pmid] = proteins
-    return pmid_map
-
-
-def dois() -> Mapping[str, list[str]]:
-    """Get mapping of DOIs to associated protein IDs."""
-    refs = get_references()
-    doi_map: dict[str, list[str]] = {}
-    for ref in refs:
-        doi = ref.get("doi")
-        if not doi:
-            continue
-        proteins = [edge["node"] for edge in ref["proteins"]["edges"]]
-        doi_map[doi] = proteins
-    return doi_map
-
-
-def get_protein_references() -> Mapping[str, list[dict]]:
-    """Get mapping of protein names to associated references (with DOI/PMID)."""
-    refs = get_references()
+def normalize_protein_name(name: str) -> str:
+    """Normalize a protein name for lookup (case-folded, whitespace removed)."""
+    return "".join(name.split()).casefold()
+
+
+@cache
+def _build_indexes() -> tuple[
+    Mapping[str, tuple[dict, ...]],
+    Mapping[str, tuple[dict, ...]],
+    Mapping[str, tuple[dict, ...]],
+    Mapping[str, tuple[str, ...]],
+]:
+    """Build the PMID, DOI, and protein-name indexes in a single pass over refs.
+
+    The indexes are cached and shared by all callers, so they are returned as
+    read-only mappings of tuples.
+    """
+    pmid_map: dict[str, tuple[dict, ...]] = {}
+    doi_map: dict[str, tuple[dict, ...]] = {}
     protein_map: dict[str, list[dict]] = defaultdict(list)
-    for ref in refs:
-        for edge in ref["proteins"]["edges"]:
-            protein_name = str(edge["node"]["name"]).lower()
-            ref_no_prots = {k: v for k, v in ref.items() if k != "proteins"}
-            protein_map[protein_name].append(ref_no_prots)
-    return protein_map
+    protein_ids_map: dict[str, list[str]] = defaultdict(list)
+    for ref in get_references():
+        proteins = tuple(edge["node"] for edge in ref["proteins"]["edges"])
+        if pmid := ref.get("pmid"):
+            pmid_map[pmid] = proteins
+        if doi := ref.get("doi"):
+            doi_map[doi] = proteins
+        # one shared dict per reference, however many proteins cite it
+        ref_no_prots = {k: v for k, v in ref.items() if k != "proteins"}
+        # prefer DOI, fallback to PMID
+        article_id = doi or pmid
+        for protein in proteins:
+            name = str(protein["name"])
+            protein_map[name.lower()].append(ref_no_prots)
+            if article_id:
+                protein_ids_map[normalize_protein_name(name)].append(article_id)
+    return (
+        MappingProxyType(pmid_map),
+        MappingProxyType(doi_map),
+        _frozen(protein_map),
+        _frozen(protein_ids_map),
+    )
+
+
+def _frozen[V](index: dict[str, list[V]]) -> Mapping[str, tuple[V, ...]]:
+    return MappingProxyType({key: tuple(values) for key, values in index.items()})
+
+
+def pmids() -> Mapping[str, tuple[dict, ...]]:
+    """Get read-only mapping of PMIDs to associated proteins."""
+    return _build_indexes()[0]
+
+
+def dois() -> Mapping[str, tuple[dict, ...]]:
+    """Get read-only mapping of DOIs to associated proteins."""
+    return _build_indexes()[1]
+
+
+def get_protein_references() -> Mapping[str, tuple[dict, ...]]:
+    """Get read-only mapping of lowercase protein names to their references.
+
+    References are dicts with the DOI and PMID.  Names without references are
+    not in the mapping, so look them up with ``.get(name, ())``.
+    """
+    return _build_indexes()[2]
+
+
+def protein_article_ids() -> Mapping[str, tuple[str, ...]]:
+    """Get read-only mapping of normalized protein names to article DOIs (or PMIDs).
+
+    Keys are produced by `normalize_protein_name`; use it on lookups as well.
+    """
+    return _build_indexes()[3]
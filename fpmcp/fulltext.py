@@ -3,15 +3,26 @@
 This module provides a unified interface for fetching full-text content from
 scientific articles using any common identifier (DOI, PMID, PMCID).
 
-The fetching strategy uses a waterfall approach:
-1. Try Europe PMC for structured JATS XML (best for tables/structured data)
+Sources are ranked by preference:
+1. Europe PMC for structured JATS XML (best for tables/structured data)
+2. Unpaywall for an open-access PDF
+3. CrossRef for a publisher PDF
+
+The metadata lookups behind the PDF sources run concurrently with the Europe
+PMC fetch, so falling back costs no extra round trips, but PDFs are only
+downloaded once the sources preferred over them have failed.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
+from operator import attrgetter
 from typing import TYPE_CHECKING, Literal
 
 from fpmcp.article_id import ArticleIdentifier
@@ -21,12 +32,31 @@ from fpmcp.http import get_session
 from fpmcp.unpaywall.utils import get_unpaywall_data
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable, Iterator
+    from concurrent.futures import Future
 
 logger = logging.getLogger(__name__)
 
+_PDF_MAGIC = b"%PDF"
+# Some servers prepend a BOM or other junk to the PDF header; like PDF readers,
+# accept the header signature anywhere within the first KB
+_PDF_SIGNATURE = b"%PDF-"
+_PDF_SNIFF_SIZE = 1024
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
-@dataclass
+# Number of fetched full texts kept in memory.  Kept small because a PDF result
+# can be tens of MB.
+FULLTEXT_CACHE_SIZE = 16
+# Number of threads for the metadata lookups of all articles, enough for two
+# lookups each of the articles the bulk server tools fetch at once
+LOOKUP_WORKERS = 16
+
+# Shared lookup executor, created on first use
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
 class FullTextResult:
     """Result of fetching full-text content.
 
@@ -37,7 +67,8 @@ class FullTextResult:
     format : str
         Content format: "xml" or "pdf"
     content : str | bytes
-        Raw content (str for XML, bytes for PDF)
+        Raw content as served: the XML document or PDF bytes (XML may also be
+        given as str)
     article_id : ArticleIdentifier
         Normalized article identifiers
     url : str
@@ -51,6 +82,28 @@ class FullTextResult:
     url: str
 
 
+@dataclass(slots=True, frozen=True)
+class FullTextInfo:
+    """Where full-text content is available, without the content itself.
+
+    Attributes
+    ----------
+    source : str
+        Where the content is available: "europmc", "unpaywall", "crossref"
+    format : str
+        Content format: "xml" or "pdf"
+    article_id : ArticleIdentifier
+        Normalized article identifiers
+    url : str
+        URL where the full-text can be accessed
+    """
+
+    source: Literal["europmc", "unpaywall", "crossref"]
+    format: Literal["xml", "pdf"]
+    article_id: ArticleIdentifier
+    url: str
+
+
 @dataclass
 class FullTextSource:
     """A lazy source for full-text content.
@@ -113,46 +166,23 @@ def get_fulltext_sources(any_id: str | ArticleIdentifier) -> list[FullTextSource
         any_id if isinstance(any_id, ArticleIdentifier) else ArticleIdentifier(any_id)
     )
 
-    sources = []
-
-    # Strategy 1: Europe PMC for structured XML
-    if article_id.pmid:
-        sources.append(
-            FullTextSource(
-                name="europmc",
-                article_id=article_id,
-                _fetch_fn=lambda aid=article_id: _try_europmc(aid),
-            )
+    return [
+        FullTextSource(
+            name=name, article_id=article_id, _fetch_fn=partial(fn, article_id)
         )
-
-    # Strategy 2: Unpaywall for PDF
-    if article_id.doi:
-        sources.append(
-            FullTextSource(
-                name="unpaywall",
-                article_id=article_id,
-                _fetch_fn=lambda aid=article_id: _try_unpaywall(aid),
-            )
-        )
-
-    # Strategy 3: CrossRef for PDF
-    if article_id.doi:
-        sources.append(
-            FullTextSource(
-                name="crossref",
-                article_id=article_id,
-                _fetch_fn=lambda aid=article_id: _try_crossref(aid),
-            )
-        )
-
-    return sources
+        for name, has_id, fn in _SOURCES
+        if has_id(article_id)
+    ]
 
 
 def get_fulltext(any_id: str | ArticleIdentifier) -> FullTextResult | None:
     """Fetch full-text content from any article identifier.
 
-    This is the main entry point for fetching full-text content. It tries
-    multiple sources in order of quality, preferring structured XML over PDF.
+    This is the main entry point for fetching full-text content. Sources are
+    tried in order of preference, structured XML before PDF, and the first
+    result is returned.  The metadata lookups of the PDF sources (Unpaywall,
+    CrossRef) run concurrently with the Europe PMC fetch, but a PDF is only
+    downloaded once every preferred source has failed.
 
     Parameters
     ----------
@@ -170,16 +200,180 @@ def get_fulltext(any_id: str | ArticleIdentifier) -> FullTextResult | None:
     >>> if result:
     ...     print(f"Found {result.format} from {result.source}")
     ...     tables = extract_tables(result)
+
+    Notes
+    -----
+    The last `FULLTEXT_CACHE_SIZE` successful results are cached, both under
+    the identifier given and under the article's normalized identifiers, so
+    asking for the same article again (by any of its IDs) doesn't refetch it.
+    Failed lookups are not cached.  Use `clear_fulltext_cache` to reset.
     """
-    # Get all available sources and try each in order
-    for source in get_fulltext_sources(any_id):
-        logger.debug("Trying source: %s", source.name)
-        if result := source():
-            return result
+    if (result := _fulltext_cache.get(input_key := _cache_key(any_id))) is not None:
+        return result
+
+    article_id = (
+        any_id if isinstance(any_id, ArticleIdentifier) else ArticleIdentifier(any_id)
+    )
+    if (result := _fulltext_cache.get(id_key := _cache_key(article_id))) is None:
+        result = _fetch_fulltext(article_id)
+    if result is not None:
+        _fulltext_cache.put(input_key, result)
+        _fulltext_cache.put(id_key, result)
+    return result
+
+
+def clear_fulltext_cache() -> None:
+    """Clear the in-memory caches of fetched full texts and their extractions."""
+    _fulltext_cache.clear()
+    _text_cache.clear()
+    _tables_cache.clear()
+
+
+def probe_fulltext(any_id: str | ArticleIdentifier) -> FullTextInfo | None:
+    """Find where full-text content is available, without downloading it.
+
+    Reports the same source `get_fulltext` would return, but each source only
+    checks that its content exists: Europe PMC is searched without fetching
+    the XML, and for PDFs only the first bytes are requested to confirm they
+    are a PDF.  As in `get_fulltext`, a PDF source is only checked once every
+    preferred source has failed.
+
+    Parameters
+    ----------
+    any_id : str | ArticleIdentifier
+        Any article identifier: DOI, PMID, or PMCID
+
+    Returns
+    -------
+    FullTextInfo | None
+        Source, format and URL of the full-text, or None if not found
+
+    Examples
+    --------
+    >>> info = probe_fulltext("10.1038/s41592-023-02085-6")
+    >>> if info:
+    ...     print(f"{info.format} available from {info.source}")
+    """
+    if (result := _fulltext_cache.get(_cache_key(any_id))) is not None:
+        return _info(result)
+
+    article_id = (
+        any_id if isinstance(any_id, ArticleIdentifier) else ArticleIdentifier(any_id)
+    )
+    if (result := _fulltext_cache.get(_cache_key(article_id))) is not None:
+        return _info(result)
+
+    probes = [
+        (source.name, partial(_PROBES[source.name], article_id))
+        for source in get_fulltext_sources(article_id)
+    ]
+    return _first_success(article_id, probes)
+
+
+def _fetch_fulltext(article_id: ArticleIdentifier) -> FullTextResult | None:
+    sources = get_fulltext_sources(article_id)
+    return _first_success(article_id, [(source.name, source) for source in sources])
+
+
+def _first_success[T](
+    article_id: ArticleIdentifier, fns: list[tuple[str, Callable[[], T | None]]]
+) -> T | None:
+    """Call `fns` in order until one returns a result.
+
+    The (cached) metadata lookups of the later sources are started at once, so
+    they are usually done by the time their source is tried; only the lookups
+    run concurrently, never the downloads.  A source whose lookup failed or
+    found nothing is skipped rather than tried, since failures aren't cached
+    and trying it would only repeat the request.
+    """
+    executor = _lookup_executor()
+    lookups = {
+        name: executor.submit(_LOOKUPS[name], article_id)
+        for name, _ in fns
+        if name in _LOOKUPS
+    }
+    try:
+        for name, fn in fns:
+            if (lookup := lookups.get(name)) is not None and not _found(lookup):
+                logger.debug("Skipping source: %s (lookup found nothing)", name)
+                continue
+            logger.debug("Trying source: %s", name)
+            if result := fn():
+                return result
+    finally:
+        # lookups already running are left to finish (and fill their caches)
+        for lookup in lookups.values():
+            lookup.cancel()
 
     return None
 
 
+def _found(lookup: Future[object]) -> bool:
+    """Wait for `lookup`, and return whether it succeeded with a result."""
+    return lookup.exception() is None and bool(lookup.result())
+
+
+def _lookup_executor() -> ThreadPoolExecutor:
+    """Get or create the executor shared by the metadata lookups."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=LOOKUP_WORKERS, thread_name_prefix="fpmcp-lookup"
+            )
+    return _executor
+
+
+def _info(result: FullTextResult) -> FullTextInfo:
+    return FullTextInfo(
+        source=result.source,
+        format=result.format,
+        article_id=result.article_id,
+        url=result.url,
+    )
+
+
+class _LRUCache[V]:
+    """Minimal thread-safe LRU mapping."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> V | None:
+        with self._lock:
+            if (value := self._data.get(key)) is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_fulltext_cache = _LRUCache[FullTextResult](FULLTEXT_CACHE_SIZE)
+# Extracted text/tables, by id() of the result they came from
+_text_cache = _LRUCache[tuple[FullTextResult, str]](FULLTEXT_CACHE_SIZE)
+_tables_cache = _LRUCache[tuple[FullTextResult, tuple[str, ...]]](FULLTEXT_CACHE_SIZE)
+
+
+def _cache_key(any_id: str | ArticleIdentifier) -> Hashable:
+    if isinstance(any_id, ArticleIdentifier):
+        # unresolved identifiers would all share the key (None, None, None)
+        if any_id.doi or any_id.pmid or any_id.pmcid:
+            return (any_id.doi, any_id.pmid, any_id.pmcid)
+        return any_id.source_id
+    return str(any_id).strip()
+
+
 def _try_europmc(article_id: ArticleIdentifier) -> FullTextResult | None:
     """Try to fetch JATS XML from Europe PMC."""
     # Need PMID to search Europe PMC
@@ -263,40 +457,200 @@ def _try_crossref(article_id: ArticleIdentifier) -> FullTextResult | None:
     return None
 
 
+def _probe_europmc(article_id: ArticleIdentifier) -> FullTextInfo | None:
+    """Check whether Europe PMC has JATS XML, without fetching it."""
+    if not article_id.pmid:
+        return None
+
+    try:
+        data = _search(f"ext_id:{article_id.pmid} src:med")
+        if not (result := data.resultList.result):
+            return None
+
+        article = result[0]
+        if article.inEPMC == "Y" and (pmcid := article.pmcid):
+            return FullTextInfo(
+                source="europmc",
+                format="xml",
+                article_id=article_id,
+                url=f"https://www.ncbi.nlm.nih.gov/pmc/articles/{pmcid}/",
+            )
+    except Exception:
+        pass
+
+    return None
+
+
+def _probe_unpaywall(article_id: ArticleIdentifier) -> FullTextInfo | None:
+    """Check whether Unpaywall's best OA location serves a PDF."""
+    if not article_id.doi:
+        return None
+
+    try:
+        data = get_unpaywall_data(article_id.doi)
+        if best_loc := data.get("best_oa_location"):
+            if (pdf_url := best_loc.get("url_for_pdf")) and _is_pdf_url(pdf_url):
+                url = (
+                    best_loc.get("url_for_landing_page")
+                    or best_loc.get("url")
+                    or pdf_url
+                )
+                return FullTextInfo(
+                    source="unpaywall", format="pdf", article_id=article_id, url=url
+                )
+    except Exception:
+        pass
+
+    return None
+
+
+def _probe_crossref(article_id: ArticleIdentifier) -> FullTextInfo | None:
+    """Check whether CrossRef's PDF link serves a PDF."""
+    if not article_id.doi:
+        return None
+
+    try:
+        data = get_fulltext_urls_from_crossref(article_id.doi)
+        if (pdf_url := data.get("pdf_url")) and _is_pdf_url(pdf_url):
+            return FullTextInfo(
+                source="crossref", format="pdf", article_id=article_id, url=pdf_url
+            )
+    except Exception:
+        pass
+
+    return None
+
+
+# Full-text sources in order of preference: name, whether an article has the
+# identifier the source needs, and the function that fetches from it
+_SOURCES: tuple[
+    tuple[
+        Literal["europmc", "unpaywall", "crossref"],
+        Callable[[ArticleIdentifier], str | None],
+        Callable[[ArticleIdentifier], FullTextResult | None],
+    ],
+    ...,
+] = (
+    # The functions are looked up when called, rather than bound here, so that
+    # patching them (e.g. in tests) takes effect
+    # Strategy 1: Europe PMC for structured XML
+    ("europmc", attrgetter("pmid"), lambda article_id: _try_europmc(article_id)),
+    # Strategy 2: Unpaywall for PDF
+    ("unpaywall", attrgetter("doi"), lambda article_id: _try_unpaywall(article_id)),
+    # Strategy 3: CrossRef for PDF
+    ("crossref", attrgetter("doi"), lambda article_id: _try_crossref(article_id)),
+)
+
+# Metadata lookups behind the PDF sources.  They are cached, so looking them up
+# ahead of time lets the source reuse the result.
+_LOOKUPS: dict[str, Callable[[ArticleIdentifier], object]] = {
+    "unpaywall": lambda article_id: get_unpaywall_data(article_id.doi or ""),
+    "crossref": lambda article_id: get_fulltext_urls_from_crossref(
+        article_id.doi or ""
+    ),
+}
+
+# Looked up when called, like the `_SOURCES` functions
+_PROBES: dict[str, Callable[[ArticleIdentifier], FullTextInfo | None]] = {
+    "europmc": lambda article_id: _probe_europmc(article_id),
+    "unpaywall": lambda article_id: _probe_unpaywall(article_id),
+    "crossref": lambda article_id: _probe_crossref(article_id),
+}
+
+
+def _is_pdf_url(url: str, timeout: int = 30) -> bool:
+    """Check that `url` serves a PDF by reading only its first bytes."""
+    try:
+        # Servers that ignore the Range header send the whole body, but it is
+        # streamed and the connection closed after the first chunk
+        with get_session().get(
+            url,
+            headers={"Range": f"bytes=0-{_PDF_SNIFF_SIZE - 1}"},
+            timeout=timeout,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+            return _sniff_pdf(chunks) is not None
+    except Exception as e:
+        logger.debug("PDF probe failed: %s: %s", type(e).__name__, e)
+        return False
+
+
+def _sniff_pdf(chunks: Iterator[bytes]) -> bytearray | None:
+    """Read the start of a body from `chunks`, returning it only if it's a PDF.
+
+    Only as many chunks as needed to find the PDF signature are consumed, so the
+    caller can continue reading the rest of the body from `chunks`.
+    """
+    content = _read_at_least(chunks, bytearray(), len(_PDF_MAGIC))
+    # fast path: the body starts with the header, as nearly all PDFs do
+    if content.startswith(_PDF_MAGIC):
+        return content
+
+    content = _read_at_least(chunks, content, _PDF_SNIFF_SIZE)
+    if content.find(_PDF_SIGNATURE, 0, _PDF_SNIFF_SIZE) != -1:
+        return content
+
+    logger.debug("Not a PDF, first bytes: %s", bytes(content[:16]))
+    return None
+
+
+def _read_at_least(chunks: Iterator[bytes], content: bytearray, size: int) -> bytearray:
+    """Append chunks to `content` until it holds at least `size` bytes (or EOF)."""
+    while len(content) < size and (chunk := next(chunks, None)) is not None:
+        content += chunk
+    return content
+
+
 def _download_pdf(url: str, timeout: int = 30) -> bytes | None:
-    """Download PDF from a URL with timing debug info."""
-    start = time.time()
+    """Download PDF from a URL with timing debug info.
+
+    The body is streamed (publisher URLs bypass the HTTP cache, see
+    `fpmcp.http.HTTP_CACHE_URLS`), and the download is abandoned as soon as its
+    first bytes show it isn't a PDF (e.g. an HTML landing or paywall page).
+    """
+    # Timing is only measured when it will be logged
+    debug = logger.isEnabledFor(logging.DEBUG)
+    start = time.perf_counter() if debug else 0.0
     try:
         logger.debug("Starting PDF download from: %s", url)
 
         # Use shared session for connection pooling
         session = get_session()
 
-        # Time the request
-        req_start = time.time()
-        response = session.get(url, timeout=timeout, stream=False)
-        req_time = time.time() - req_start
-        logger.debug("Request took %.2fs, status: %d", req_time, response.status_code)
+        with session.get(url, timeout=timeout, stream=True) as response:
+            if debug:
+                logger.debug(
+                    "Request took %.2fs, status: %d",
+                    time.perf_counter() - start,
+                    response.status_code,
+                )
+
+            response.raise_for_status()
+
+            chunks = response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+            # Verify it's actually a PDF before reading the rest
+            if (content := _sniff_pdf(chunks)) is None:
+                return None
 
-        response.raise_for_status()
+            for chunk in chunks:
+                content += chunk
 
-        # Verify it's actually a PDF
-        if response.content[:4] == b"%PDF":
-            total_time = time.time() - start
-            size_mb = len(response.content) / (1024 * 1024)
+        if debug:
+            total_time = time.perf_counter() - start
+            size_mb = len(content) / (1024 * 1024)
             logger.debug(
                 "Downloaded %.2fMB PDF in %.2fs (%.2fMB/s)",
                 size_mb,
                 total_time,
-                size_mb / total_time,
+                size_mb / total_time if total_time else float("inf"),
             )
-            return response.content
-        else:
-            logger.debug("Not a PDF, first 4 bytes: %s", response.content[:4])
+        return bytes(content)
     except Exception as e:
-        elapsed = time.time() - start
-        logger.debug("Failed after %.2fs: %s: %s", elapsed, type(e).__name__, e)
-        pass
+        if debug:
+            elapsed = time.perf_counter() - start
+            logger.debug("Failed after %.2fs: %s: %s", elapsed, type(e).__name__, e)
 
     return None
 
@@ -304,6 +658,9 @@ def _download_pdf(url: str, timeout: int = 30) -> bytes | None:
 def extract_tables(fulltext: FullTextResult) -> list[str]:
     """Extract tables from full-text content as markdown.
 
+    Tables are cached for recently used results, so calling this again on the
+    same result doesn't reparse its content.
+
     Parameters
     ----------
     fulltext : FullTextResult
@@ -320,14 +677,17 @@ def extract_tables(fulltext: FullTextResult) -> list[str]:
     >>> tables = extract_tables(result)
     >>> print(tables[0])
     """
+    return list(_memoized(_tables_cache, fulltext, _extract_tables))
+
+
+def _extract_tables(fulltext: FullTextResult) -> tuple[str, ...]:
     if fulltext.format == "xml":
-        assert isinstance(fulltext.content, str)
-        return _extract_tables_from_xml(fulltext.content)
+        return tuple(_extract_tables_from_xml(fulltext.content))
     else:  # PDF
         raise NotImplementedError("PDF table extraction not yet implemented")
 
 
-def _extract_tables_from_xml(xml_content: str) -> list[str]:
+def _extract_tables_from_xml(xml_content: str | bytes) -> list[str]:
     """Extract tables from JATS XML using existing iter_tables utility."""
     from fpmcp.util import iter_tables
 
@@ -337,6 +697,9 @@ def _extract_tables_from_xml(xml_content: str) -> list[str]:
 def extract_text(fulltext: FullTextResult) -> str:
     """Extract plain text from full-text content.
 
+    Text is cached for recently used results, so calling this again on the
+    same result (e.g. for several searches) doesn't reparse its content.
+
     Parameters
     ----------
     fulltext : FullTextResult
@@ -352,8 +715,11 @@ def extract_text(fulltext: FullTextResult) -> str:
     >>> result = get_fulltext("10.1038/s41592-023-02085-6")
     >>> text = extract_text(result)
     """
+    return _memoized(_text_cache, fulltext, _extract_text)
+
+
+def _extract_text(fulltext: FullTextResult) -> str:
     if fulltext.format == "xml":
-        assert isinstance(fulltext.content, str)
         try:
             return _extract_text_from_xml(fulltext.content)
         except Exception as e:
@@ -368,13 +734,35 @@ def extract_text(fulltext: FullTextResult) -> str:
             return ""
 
 
-def _extract_text_from_xml(xml_content: str) -> str:
+def _memoized[V](
+    cache: _LRUCache[tuple[FullTextResult, V]],
+    fulltext: FullTextResult,
+    extract: Callable[[FullTextResult], V],
+) -> V:
+    """Return `extract(fulltext)`, reusing the value cached for this result.
+
+    Results are keyed on identity, since hashing their (possibly MB-sized)
+    content would cost about as much as extracting it.  Each entry keeps its
+    result alive, so an id can't be reused by another result while cached.
+    """
+    if (hit := cache.get(id(fulltext))) is not None:
+        return hit[1]
+    value = extract(fulltext)
+    cache.put(id(fulltext), (fulltext, value))
+    return value
+
+
+def _extract_text_from_xml(xml_content: str | bytes) -> str:
     """Extract plain text from JATS XML."""
-    import xml.etree.ElementTree as ET
+    from lxml import etree
+
+    from fpmcp.util import parse_xml
 
-    root = ET.fromstring(xml_content)
-    # Get all text content, preserving some structure
-    return "".join(root.itertext())
+    root = parse_xml(xml_content)
+    # Get all text content, preserving some structure.  Serializing with the
+    # "text" method concatenates every text node in libxml2, without walking
+    # the tree from Python.
+    return etree.tostring(root, method="text", encoding="unicode", with_tail=False)
 
 
 def _extract_text_from_pdf(pdf_bytes: bytes) -> str:
@@ -397,16 +785,17 @@ def _extract_text_from_pdf(pdf_bytes: bytes) -> str:
 
     # Open PDF from bytes (no file I/O needed)
     doc = pdfium.PdfDocument(pdf_bytes)
-
-    # Extract text from all pages using a generator for memory efficiency
-    # This avoids loading all text into memory at once for large PDFs
-    text_parts = []
-    for page in doc:
-        textpage = page.get_textpage()
-        text_parts.append(textpage.get_text_range())
-
-    # Close the document to free resources
-    doc.close()
+    try:
+        text_parts = []
+        for page in doc:
+            textpage = page.get_textpage()
+            text_parts.append(textpage.get_text_range())
+            # Release each page as soon as its text is read, so only one
+            # page is held in native memory at a time, not the whole document
+            textpage.close()
+            page.close()
+    finally:
+        doc.close()
 
     # Join all page text
     return "".join(text_parts)
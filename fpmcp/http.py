@@ -7,14 +7,39 @@ HTTP requests throughout the application. Benefits:
 2. Keep-alive connections reduce latency
 3. Consistent headers and configuration
 4. Better performance for multiple requests
+5. Persistent HTTP cache - API responses (article metadata and full-text
+   XML) are stored on disk and revalidated with conditional requests
+   (ETag/Last-Modified), so refetching an article across runs costs a 304
+   rather than a full download.  Other responses, notably PDFs from
+   publishers, bypass the cache and are streamed.
 """
 
 from __future__ import annotations
 
-import requests
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import requests_cache
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+if TYPE_CHECKING:
+    import requests
+
+# Name of the SQLite HTTP cache, stored in the user cache directory
+HTTP_CACHE_NAME = "fpmcp_http"
+# How long to keep responses that don't set their own Cache-Control/Expires
+HTTP_CACHE_EXPIRE_AFTER = timedelta(days=30)
+# URL prefixes of the only responses that are cached: small JSON and XML API
+# responses.  The cache reads and stores the whole body of a response it keeps,
+# which would defeat streaming (and fill the disk) for PDF downloads and probes.
+HTTP_CACHE_URLS = (
+    "https://api.unpaywall.org/v2/",
+    "https://api.crossref.org/works/",
+    "https://www.ebi.ac.uk/europepmc/webservices/rest/",
+    "https://pmc.ncbi.nlm.nih.gov/tools/idconv/",
+)
+
 # Singleton session
 _session: requests.Session | None = None
 
@@ -25,8 +50,8 @@ def get_session() -> requests.Session:
     Returns
     -------
     requests.Session
-        Configured session with connection pooling, retries, and browser-like
-        headers
+        Configured session with connection pooling, retries, a persistent
+        HTTP cache for API responses, and browser-like headers
 
     Examples
     --------
@@ -36,7 +61,16 @@ def get_session() -> requests.Session:
     """
     global _session
     if _session is None:
-        _session = requests.Session()
+        _session = requests_cache.CachedSession(
+            HTTP_CACHE_NAME,
+            backend="sqlite",
+            use_cache_dir=True,
+            expire_after=HTTP_CACHE_EXPIRE_AFTER,
+            cache_control=True,
+            filter_fn=_is_cacheable,
+        )
+        # expired responses are otherwise kept on disk forever
+        _session.cache.delete(expired=True)
 
         # Configure retry strategy
         retry_strategy = Retry(
@@ -68,6 +102,17 @@ def get_session() -> requests.Session:
     return _session
 
 
+def _is_cacheable(response: requests.Response) -> bool:
+    """Whether to store `response` in the HTTP cache.
+
+    Checked before the body is read, so other responses are still streamed.
+    Only URLs in `HTTP_CACHE_URLS` are stored, because response headers (e.g.
+    a publisher's ``Cache-Control: max-age``) would otherwise make any of them
+    cacheable.
+    """
+    return (url := response.url) is not None and url.startswith(HTTP_CACHE_URLS)
+
+
 def reset_session() -> None:
     """Reset the session (useful for testing).
 
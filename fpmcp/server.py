@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
+import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from fastmcp import FastMCP
 
-from fpmcp.fpbase.query import get_protein_references
-from fpmcp.fulltext import extract_tables, extract_text, get_fulltext
+from fpmcp.article_id import ArticleIdentifier
+from fpmcp.fpbase.query import normalize_protein_name, protein_article_ids
+from fpmcp.fulltext import extract_tables, extract_text, get_fulltext, probe_fulltext
+
+if TYPE_CHECKING:
+    from fpmcp.fulltext import FullTextInfo
+
+logger = logging.getLogger(__name__)
 
 mcp = FastMCP("FP Research Server")
 
+# Maximum number of articles fetched at once by the bulk tools, to stay within
+# publisher and API rate limits
+MAX_CONCURRENT_ARTICLES = 8
+
 
 @mcp.tool
 def get_article_tables(article_id: str) -> list[str]:
@@ -39,13 +53,62 @@ def get_article_tables(article_id: str) -> list[str]:
     2. Search the returned tables for "StayGold" and "QY" or "quantum yield"
     3. Extract the corresponding value from the table
     """
-    result = get_fulltext(article_id)
-    if result is None:
-        return []
+    return _article_tables(article_id)
+
+
+@mcp.tool
+def get_articles_tables(article_ids: list[str]) -> dict[str, list[str]]:
+    """Get all tables from several scientific articles as markdown.
+
+    Same as calling get_article_tables() for each article, but the articles
+    are fetched concurrently, so this is much faster than one call per article.
+
+    Parameters
+    ----------
+    article_ids : list[str]
+        Article identifiers: DOIs, PMIDs, or PMCIDs (may be mixed)
 
+    Returns
+    -------
+    dict[str, list[str]]
+        Tables in markdown format for each requested identifier.  Articles
+        whose full-text could not be found, or whose tables could not be
+        extracted (e.g. PDF-only articles), map to an empty list.
+
+    Examples
+    --------
+    To compare the quantum yield of StayGold across its papers:
+    1. Call get_protein_article_ids("StayGold") to get article identifiers
+    2. Call get_articles_tables(identifiers)
+    3. Search each article's tables for "quantum yield" or "QY"
+    """
+    if not (unique_ids := list(dict.fromkeys(article_ids))):
+        return {}
+
+    workers = min(len(unique_ids), MAX_CONCURRENT_ARTICLES)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        tables = executor.map(_try_article_tables, unique_ids)
+        return dict(zip(unique_ids, tables, strict=True))
+
+
+def _article_tables(article_id: str) -> list[str]:
+    if (result := get_fulltext(article_id)) is None:
+        return []
     return extract_tables(result)
 
 
+def _try_article_tables(article_id: str) -> list[str]:
+    # one failing article (e.g. PDF-only, whose tables can't be extracted yet)
+    # shouldn't fail the whole batch
+    try:
+        return _article_tables(article_id)
+    except Exception as e:
+        logger.warning(
+            "Could not get tables for %s: %s: %s", article_id, type(e).__name__, e
+        )
+        return []
+
+
 @mcp.tool
 def get_article_text(article_id: str) -> str:
     """Get full text content from a scientific article.
@@ -89,18 +152,56 @@ def get_article_info(article_id: str) -> dict[str, str]:
         - pmid: PubMed ID (if available)
         - pmcid: PubMed Central ID (if available)
         - url: URL where the full-text can be accessed
+
+    Notes
+    -----
+    Availability is checked without downloading the full-text, so this is
+    cheap to call before get_article_tables() or get_article_text().
     """
-    result = get_fulltext(article_id)
-    if result is None:
+    return _info_dict(probe_fulltext(article_id))
+
+
+@mcp.tool
+def get_articles_info(article_ids: list[str]) -> dict[str, dict[str, str]]:
+    """Get metadata and full-text availability for several articles at once.
+
+    Same as calling get_article_info() for each article, but identifiers are
+    resolved in batched requests and articles are checked concurrently.
+
+    Parameters
+    ----------
+    article_ids : list[str]
+        Article identifiers: DOIs, PMIDs, or PMCIDs (may be mixed)
+
+    Returns
+    -------
+    dict[str, dict]
+        The get_article_info() dictionary for each requested identifier.
+    """
+    if not (unique_ids := list(dict.fromkeys(article_ids))):
+        return {}
+
+    articles = ArticleIdentifier.bulk(unique_ids)
+    workers = min(len(articles), MAX_CONCURRENT_ARTICLES)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        infos = executor.map(probe_fulltext, articles)
+        return {
+            article_id: _info_dict(info)
+            for article_id, info in zip(unique_ids, infos, strict=True)
+        }
+
+
+def _info_dict(info: FullTextInfo | None) -> dict[str, str]:
+    if info is None:
         return {"error": "Full-text not found"}
 
     return {
-        "source": result.source,
-        "format": result.format,
-        "doi": result.article_id.doi or "",
-        "pmid": result.article_id.pmid or "",
-        "pmcid": result.article_id.pmcid or "",
-        "url": result.url,
+        "source": info.source,
+        "format": info.format,
+        "doi": info.article_id.doi or "",
+        "pmid": info.article_id.pmid or "",
+        "pmcid": info.article_id.pmcid or "",
+        "url": info.url,
     }
 
 
@@ -190,25 +291,31 @@ def search_article_text(
     if not (result := get_fulltext(article_id)) or not (text := extract_text(result)):
         return []
 
+    text_len = len(text)
     matches = []
-    for match in re.finditer(pattern, text, re.IGNORECASE):
-        start = max(0, match.start() - context_chars)
-        end = min(len(text), match.end() + context_chars)
-
-        # Add ellipsis if we're not at the start/end
-        snippet = text[start:end]
-        if start > 0:
-            snippet = "..." + snippet
-        if end < len(text):
-            snippet = snippet + "..."
-
+    for match in _compile_pattern(pattern).finditer(text):
+        match_start, match_end = match.span()
+        start = max(0, match_start - context_chars)
+        end = min(text_len, match_end + context_chars)
+
+        # Add ellipsis if we're not at the start/end, building the snippet once
+        prefix = "..." if start > 0 else ""
+        suffix = "..." if end < text_len else ""
+        snippet = f"{prefix}{text[start:end]}{suffix}"
         matches.append(
-            {"text": snippet, "position": match.start(), "match": match.group()}
+            {"text": snippet, "position": match_start, "match": match.group()}
         )
 
     return matches
 
 
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    # agents tend to repeat the same searches across many articles, and this
+    # keeps them compiled even when other regex use churns the `re` module cache
+    return re.compile(pattern, re.IGNORECASE)
+
+
 @mcp.tool
 def get_protein_article_ids(protein_name: str) -> list[str]:
     """Get article identifiers (DOI/PMID) for a fluorescent protein.
@@ -220,7 +327,8 @@ def get_protein_article_ids(protein_name: str) -> list[str]:
     Parameters
     ----------
     protein_name : str
-        Name of the fluorescent protein (e.g., "StayGold", "mCherry", "EGFP")
+        Name of the fluorescent protein (e.g., "StayGold", "mCherry", "EGFP").
+        Matching ignores case and whitespace.
 
     Returns
     -------
@@ -237,13 +345,6 @@ def get_protein_article_ids(protein_name: str) -> list[str]:
     3. Search the tables for "quantum yield" or "QY"
     4. If not found in tables, call get_article_text(identifier) and search
     """
-    protein_refs = get_protein_references()
-    article_ids = []
-    for ref in protein_refs.get(protein_name.lower(), []):
-        # Prioritize DOI, fallback to PMID
-        if ref.get("doi"):
-            article_ids.append(ref["doi"])
-        elif ref.get("pmid"):
-            article_ids.append(ref["pmid"])
-
-    return article_ids
+    # a list copied from the (read-only) cached index
+    key = normalize_protein_name(protein_name)
+    return list(protein_article_ids().get(key, ()))
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from functools import cache
+from functools import lru_cache
+
+import orjson
 
 from fpmcp.http import get_session
 
 EMAIL = "talley@hms.harvard.edu"
 
 
-@cache
 def get_unpaywall_data(doi: str) -> dict:
     """Check Unpaywall for OA availability.
 
@@ -20,8 +21,23 @@ def get_unpaywall_data(doi: str) -> dict:
     -------
     DOISchema
         The Unpaywall response containing OA location and metadata.
+
+    Notes
+    -----
+    Results for recently seen DOIs are kept in memory; responses are also
+    stored in the persistent HTTP cache of `fpmcp.http.get_session`, so they
+    survive restarts.  Each call returns a new dict, which the caller may
+    modify.
     """
+    # DOIs are case-insensitive, so normalize them for better cache hits
+    return orjson.loads(_get_unpaywall_data(doi.strip().lower()))
+
+
+@lru_cache(maxsize=1024)
+def _get_unpaywall_data(doi: str) -> bytes:
+    # the raw JSON is cached, rather than the parsed (mutable, nested) dict, so
+    # that no caller can change what the next one gets
     url = f"https://api.unpaywall.org/v2/{doi}"
     response = get_session().get(url, params={"email": EMAIL})
     response.raise_for_status()
-    return response.json()
+    return response.content
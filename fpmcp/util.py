@@ -1,11 +1,30 @@
 from __future__ import annotations
 
 import re
-import xml.etree.ElementTree as ET
+from io import BytesIO
+from itertools import chain, repeat
 from typing import TYPE_CHECKING
 
+from lxml import etree
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from typing import Any
+
+# Comments and processing instructions carry no content, and lxml (unlike
+# ElementTree) would otherwise keep them as children when walking table cells.
+# Nothing looks elements up by ID, so the parser needn't build an ID table.
+_XML_PARSER_OPTIONS: dict[str, Any] = {
+    "huge_tree": True,
+    "remove_comments": True,
+    "remove_pis": True,
+    "collect_ids": False,
+}
+# Documents given as str are fed to lxml encoded as UTF-8 (see `_xml_source`),
+# so their encoding is fixed rather than taken from the XML declaration.  Bytes
+# are parsed as-is, in the encoding they declare.
+_XML_STR_PARSER = etree.XMLParser(encoding="utf-8", **_XML_PARSER_OPTIONS)
+_XML_BYTES_PARSER = etree.XMLParser(**_XML_PARSER_OPTIONS)
 
 # Normalize multiple whitespace characters (spaces, newlines, tabs) into single space
 _WHITESPACE_RE = re.compile(r"\s+")
@@ -17,38 +36,87 @@ _INLINE_LEGEND_RE = re.compile(r"([a-z])([A-Z].*?)(?=\.\s*[a-z][A-Z]|$)")
 # Match legend marker at start: 1-2 lowercase letters followed by text
 _LEGEND_MARKER_RE = re.compile(r"^([a-z]{1,2})(.+)$")
 
+# Common Unicode characters in table text, and their ASCII equivalents
+_UNICODE_TO_ASCII = str.maketrans(
+    {
+        "\u2009": " "  # Thin space
+    }
+)
 
-def iter_tables(xml: str) -> Iterator[str]:
-    """Parse JATS XML tables to markdown, handling rowspan/colspan.
 
-    This function parses JATS XML tables and handles multi-level headers with
-    rowspan and colspan attributes, converting them into readable markdown tables.
+def parse_xml(xml: str | bytes) -> etree._Element:
+    """Parse an XML document (such as JATS full text) with lxml."""
+    data, encoding = _xml_source(xml)
+    parser = _XML_STR_PARSER if encoding else _XML_BYTES_PARSER
+    return etree.fromstring(data, parser)
 
-    PMC and Europe PMC normalize to JATS.  Elsevier, Springer, and Wiley might not.
-    """
-    root = ET.fromstring(xml)
-    for table_wrap in root.findall(".//table-wrap"):
-        elem = table_wrap.find(".//label")
-        label = "".join(elem.itertext()).strip() if elem is not None else ""
-
-        elem = table_wrap.find(".//caption")
-        caption = "".join(elem.itertext()).strip() if elem is not None else ""
 
-        elem = table_wrap.find(".//table-wrap-foot")
-        legend = "".join(elem.itertext()).strip() if elem is not None else ""
+def _xml_source(xml: str | bytes) -> tuple[bytes, str | None]:
+    """Return XML as bytes for lxml, and the encoding to force (if any)."""
+    if isinstance(xml, str):
+        # lxml refuses str input that carries an encoding declaration
+        return xml.encode("utf-8"), "utf-8"
+    # raw bytes (e.g. straight from an HTTP response) skip a decode/encode trip
+    return xml, None
 
-        if (table := table_wrap.find(".//table")) is None:
-            continue
 
-        thead = table.find(".//thead")
-        headers = _parse_thead(thead) if thead is not None else []
-        tbody = table.find(".//tbody")
-        rows = _parse_tbody(tbody) if tbody is not None else []
+def iter_tables(xml: str | bytes) -> Iterator[str]:
+    """Parse JATS XML tables to markdown, handling rowspan/colspan.
 
-        yield _to_markdown(label, caption, legend, headers, rows)
+    This function parses JATS XML tables and handles multi-level headers with
+    rowspan and colspan attributes, converting them into readable markdown tables.
 
+    PMC and Europe PMC normalize to JATS.  Elsevier, Springer, and Wiley might not.
 
-def _get_cell_text(elem: ET.Element) -> str:
+    The document is parsed incrementally, and everything before each table is
+    discarded once the table is converted, so memory stays bounded by the
+    largest table rather than the whole article.
+    """
+    data, encoding = _xml_source(xml)
+    for _, table_wrap in etree.iterparse(
+        BytesIO(data),
+        events=("end",),
+        tag="table-wrap",
+        encoding=encoding,
+        **_XML_PARSER_OPTIONS,
+    ):
+        if (markdown := _table_wrap_to_markdown(table_wrap)) is not None:
+            yield markdown
+        # free this table and the (already parsed) content preceding it
+        table_wrap.clear(keep_tail=True)
+        while table_wrap.getprevious() is not None:
+            del table_wrap.getparent()[0]
+
+
+def _table_wrap_to_markdown(table_wrap: etree._Element) -> str | None:
+    """Convert a <table-wrap> to markdown, or None if it has no table."""
+    label = _child_text(table_wrap, "label")
+    caption = _child_text(table_wrap, "caption")
+    legend = _child_text(table_wrap, "table-wrap-foot")
+
+    # <table> may sit inside <alternatives>, so search descendants for it; the
+    # other parts are direct children in JATS
+    if (table := next(table_wrap.iter("table"), None)) is None:
+        return None
+
+    thead = next(table.iterchildren("thead"), None)
+    headers = _parse_thead(thead) if thead is not None else []
+    tbody = next(table.iterchildren("tbody"), None)
+    rows = _parse_tbody(tbody) if tbody is not None else []
+
+    return _to_markdown(label, caption, legend, headers, rows)
+
+
+def _child_text(parent: etree._Element, tag: str) -> str:
+    """Return the stripped text content of the first `tag` child, or ""."""
+    if (elem := next(parent.iterchildren(tag), None)) is None:
+        return ""
+    # serializing as text is a single libxml2 call, unlike joining itertext()
+    text = etree.tostring(elem, method="text", encoding="unicode", with_tail=False)
+    return text.strip()
+
+
+def _get_cell_text(elem: etree._Element) -> str:
     """Extract text from cell using semantic XML structure.
 
     Based on XML structure, not heuristics:
@@ -57,42 +125,47 @@ def _get_cell_text(elem: ET.Element) -> str:
     - <sup>3</sup>, <sup>-1</sup> → exponent, convert to ^ notation
     - <sub>f</sub> → subscript, keep inline (or could use _ notation)
     """
-    parts = []
-    if elem.text:
-        parts.append(elem.text)
-
-    for child in elem:
-        if child.tag == "xref":
-            if child.tail:
-                parts.append(child.tail)
-            continue
-
-        if child.tag in ("sup", "sub"):
-            if child.find(".//xref") is not None:
-                if child.tail:
-                    parts.append(child.tail)
-                continue
-
-            child_text = "".join(child.itertext()).strip()
-            if child_text.isalpha() and len(child_text) <= 2:
-                parts.append(f" {child_text}")
-            elif child_text:
-                prefix = "^" if child.tag == "sup" else "_"
-                parts.append(f"{prefix}{child_text}")
+    if len(elem) == 0:
+        # fast path for the most common cells, with only text (str.split()
+        # splits on the same Unicode whitespace as the regex below)
+        return " ".join(elem.text.split()) if elem.text else ""
+
+    # Walked iteratively with one frame per nested element.  As each element is
+    # finished, its own text is collapsed and stripped before joining its
+    # parent's, exactly like recursing into it would.
+    stack = [(elem, iter(elem), [elem.text] if elem.text else [])]
+    while True:
+        node, children, parts = stack[-1]
+        for child in children:
+            if child.tag == "xref":
+                pass
+            elif child.tag in ("sup", "sub"):
+                if next(child.iter("xref"), None) is None:
+                    child_text = "".join(child.itertext()).strip()
+                    if child_text.isalpha() and len(child_text) <= 2:
+                        parts.append(f" {child_text}")
+                    elif child_text:
+                        prefix = "^" if child.tag == "sup" else "_"
+                        parts.append(f"{prefix}{child_text}")
+            else:
+                stack.append((child, iter(child), [child.text] if child.text else []))
+                break
             if child.tail:
                 parts.append(child.tail)
-            continue
-
-        parts.append(_get_cell_text(child))
-        if child.tail:
-            parts.append(child.tail)
-
-    return _WHITESPACE_RE.sub(" ", "".join(parts)).strip()
+        else:
+            text = _WHITESPACE_RE.sub(" ", "".join(parts)).strip()
+            stack.pop()
+            if not stack:
+                return text
+            parent_parts = stack[-1][2]
+            parent_parts.append(text)
+            if node.tail:
+                parent_parts.append(node.tail)
 
 
-def _parse_thead(thead: ET.Element) -> list[str]:
+def _parse_thead(thead: etree._Element) -> list[str]:
     """Parse table header with rowspan/colspan into flattened list."""
-    if not (header_rows := thead.findall(".//tr")):
+    if not (header_rows := list(thead.iterchildren("tr"))):
         return []
 
     num_rows = len(header_rows)
@@ -100,70 +173,78 @@ def _parse_thead(thead: ET.Element) -> list[str]:
 
     for row_idx, tr in enumerate(header_rows):
         col_idx = 0
-        for th in tr.findall(".//th"):
+        for th in tr.iterchildren("th"):
             while col_idx < len(grid[row_idx]) and grid[row_idx][col_idx] is not None:
                 col_idx += 1
 
-            cell_text = _get_cell_text(th)
             rowspan = int(th.get("rowspan", "1"))
             colspan = int(th.get("colspan", "1"))
-
-            for r_offset in range(rowspan):
-                if (r := row_idx + r_offset) >= num_rows:
-                    break
-                for c_offset in range(colspan):
-                    target_col = col_idx + c_offset
-                    while len(grid[r]) <= target_col:
-                        grid[r].append(None)
-                    grid[r][target_col] = cell_text if c_offset == 0 else ""
+            if colspan > 0:
+                # the cell's text followed by "" for each column it spans
+                span = [_get_cell_text(th), *repeat("", colspan - 1)]
+                end_col = col_idx + colspan
+                for row in grid[row_idx : row_idx + rowspan]:
+                    # grow each row at most once per cell, not per column
+                    if len(row) < end_col:
+                        row.extend(repeat(None, end_col - len(row)))
+                    row[col_idx:end_col] = span
 
             col_idx += colspan
 
-    num_cols = max(len(row) for row in grid) if grid else 0
+    num_cols = max(len(row) for row in grid)
+    for row in grid:
+        row.extend(repeat("", num_cols - len(row)))
+
+    # In one pass per row, resolve empty cells (e.g. spanned columns) to the
+    # nearest non-blank cell on their left; unfilled positions stay None
+    resolved: list[list[str | None]] = []
     for row in grid:
-        while len(row) < num_cols:
-            row.append("")
+        resolved_row: list[str | None] = []
+        last = None
+        for cell in row:
+            # cell text comes from _get_cell_text, so it's already stripped
+            if cell:
+                last = cell
+            elif cell is not None:
+                cell = last
+            resolved_row.append(cell)
+        resolved.append(resolved_row)
 
     final_headers = []
-    for col_idx in range(num_cols):
-        header_parts = []
-        prev_value = None
-        for row in grid:
-            cell = row[col_idx]
-            if cell == "":
-                for left_col in range(col_idx - 1, -1, -1):
-                    if (left_cell := row[left_col]) and left_cell.strip():
-                        cell = left_cell
-                        break
-            if cell and cell.strip() and cell != prev_value:
+    for column in zip(*resolved, strict=True):
+        header_parts: list[str] = []
+        for cell in column:
+            if cell is not None and (not header_parts or cell != header_parts[-1]):
                 header_parts.append(cell)
-                prev_value = cell
-        final_headers.append(" > ".join(header_parts) if header_parts else "")
+        final_headers.append(" > ".join(header_parts))
 
     return final_headers
 
 
-def _parse_tbody(tbody: ET.Element) -> list[list[str]]:
+def _parse_tbody(tbody: etree._Element) -> list[list[str]]:
     """Parse table body rows."""
+    # rows and cells are direct children, so cells of any table nested inside a
+    # cell aren't mistaken for rows/cells of this one
     return [
-        [_get_cell_text(td) for td in tr.findall(".//td")]
-        for tr in tbody.findall(".//tr")
+        [_get_cell_text(td) for td in tr.iterchildren("td")]
+        for tr in tbody.iterchildren("tr")
     ]
 
 
 def _format_legend(legend: str) -> str:
     """Format legend as bulleted list."""
-    inline_matches = _INLINE_LEGEND_RE.findall(legend)
-    if inline_matches and len(inline_matches) > 2:
+    # findall's tuples are cheaper here than finditer match objects or a
+    # re.sub callback, which were both measured slower
+    if len(inline_matches := _INLINE_LEGEND_RE.findall(legend)) > 2:
         items = [
-            f"- {m}: {t.strip().rstrip('.')}"
+            f"- {m}: {text}"
             for m, t in inline_matches
-            if t.strip().rstrip(".")
+            if (text := t.strip().rstrip("."))
         ]
         if items:
             return "\n".join(items)
 
-    parts = [p.strip() for p in legend.split(";") if p.strip()]
+    parts = [part for p in legend.split(";") if (part := p.strip())]
     items = []
     for part in parts:
         if match := _LEGEND_MARKER_RE.match(part):
@@ -175,12 +256,7 @@ def _format_legend(legend: str) -> str:
 
 def _replace_common_unicode(text: str) -> str:
     """Replace common Unicode characters with ASCII equivalents."""
-    replacements = {
-        "\u2009": " "  # Thin space
-    }
-    for uni_char, ascii_equiv in replacements.items():
-        text = text.replace(uni_char, ascii_equiv)
-    return text
+    return text.translate(_UNICODE_TO_ASCII)
 
 
 def _to_markdown(
@@ -198,21 +274,19 @@ def _to_markdown(
         lines.append(f"**{label}**\n")
 
     # Add table headers and data
+    num_cols = len(headers)
     if headers:
-        lines.extend(
-            [
-                "| " + " | ".join(headers) + " |",
-                "| " + " | ".join(["---"] * len(headers)) + " |",
-            ]
-        )
+        lines.append(f"| {' | '.join(headers)} |")
+        lines.append(f"|{' --- |' * num_cols}")
 
-    for row in rows:
-        row.extend([""] * (len(headers) - len(row)))
-        lines.append("| " + " | ".join(row) + " |")
+    # short rows are padded with empty cells, without modifying the row itself
+    lines.extend(
+        f"| {' | '.join(chain(row, repeat('', num_cols - len(row))))} |" for row in rows
+    )
 
     # Add legend/footnotes at the end
     if legend:
         lines.append("\n**Legend:**")
         lines.append(_format_legend(legend))
 
-    return "\n".join(map(_replace_common_unicode, lines))
+    return _replace_common_unicode("\n".join(lines))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+import pytest
+from fpmcp.europmc import get_fulltext_from_europmc
+from fpmcp.fulltext import get_fulltext
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from fpmcp.fulltext import FullTextResult
+
+# PMID 38036853, an open-access paper with useful tables
+EXAMPLE_DOI = "10.1038/s41592-023-02085-6"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        help="run tests marked 'network', which call the external HTTP APIs",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(scope="session")
+def show(pytestconfig: pytest.Config) -> Callable[..., None]:
+    """Print objects with rich when output isn't captured (`-s`), else do nothing.
+
+    Pass `markdown=True` to render strings (e.g. extracted tables) as markdown.
+    """
+    # "no" for both -s and --capture=no
+    if pytestconfig.getoption("capture") != "no":
+        return lambda *objects, markdown=False: None
+
+    from rich.console import Console
+    from rich.markdown import Markdown
+
+    console = Console()
+
+    def _show(*objects: object, markdown: bool = False) -> None:
+        if markdown:
+            objects = tuple(Markdown(str(obj)) for obj in objects)
+        console.print(*objects)
+
+    return _show
+
+
+@pytest.fixture(scope="session")
+def europmc_xml() -> Callable[[str], str | None]:
+    """Fetch Europe PMC full-text XML, once per PMID for the whole session."""
+    return cache(get_fulltext_from_europmc)
+
+
+@pytest.fixture(scope="session")
+def example_fulltext() -> FullTextResult | None:
+    """Full text of EXAMPLE_DOI, fetched once for the whole session."""
+    return get_fulltext(EXAMPLE_DOI)
@@ -1,10 +1,16 @@
 #!/usr/bin/env python
 """Quick test of ArticleIdentifier with a specific DOI."""
 
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import orjson
 import pytest
-from fpmcp.article_id import ArticleIdentifier
+from fpmcp.article_id import IDCONV_BATCH_SIZE, IDCONV_URL, ArticleIdentifier
 
 
+@pytest.mark.network
 @pytest.mark.parametrize(
     "identifier", ["10.1038/s41592-023-02085-6", "38036853", "PMC11009113"]
 )
@@ -14,3 +20,63 @@ def test_article_identifier(identifier: str) -> None:
     assert article.doi == "10.1038/s41592-023-02085-6"
     assert article.pmid == "38036853"
     assert article.pmcid == "PMC11009113"
+
+
+@pytest.mark.network
+def test_article_identifier_bulk() -> None:
+    identifiers = ["10.1038/s41592-023-02085-6", "38036853", "PMC11009113"]
+    articles = ArticleIdentifier.bulk(identifiers)
+    assert [a.source_id for a in articles] == identifiers
+    assert articles == [ArticleIdentifier(i) for i in identifiers]
+
+
+def _fake_get(url: str, params: dict[str, Any], timeout: float) -> SimpleNamespace:
+    """Stand-in for the API requests: PMIDs from 9000 up aren't in PMC."""
+    if url == IDCONV_URL:
+        records = []
+        for id_value in params["ids"].split(","):
+            if id_value.isdigit() and int(id_value) >= 9000:
+                records.append({"requested-id": id_value, "status": "error"})
+            elif id_value.startswith("10."):
+                # DOIs may be echoed in a different form
+                echoed = f"doi:{id_value.upper()}"
+                records.append({"requested-id": echoed, "pmid": 1, "pmcid": "PMC1"})
+            else:
+                records.append({"requested-id": id_value, "pmid": 1, "pmcid": "PMC1"})
+        data = {"status": "ok", "records": records}
+    else:
+        hit = {"doi": "10.1/epmc", "pmid": params["query"].removeprefix("ext_id:")}
+        data = {"hitCount": 1, "resultList": {"result": [hit]}}
+    return SimpleNamespace(content=orjson.dumps(data), raise_for_status=Mock())
+
+
+def test_article_identifier_bulk_offline(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that bulk lookups are batched per identifier type."""
+    session = Mock()
+    session.get.side_effect = _fake_get
+    monkeypatch.setattr("fpmcp.article_id.get_session", lambda: session)
+
+    pmids = [str(i) for i in range(1, IDCONV_BATCH_SIZE + 2)]
+    identifiers = [*pmids, "10.1234/abc", "9001", "not an id"]
+    articles = ArticleIdentifier.bulk(identifiers)
+    assert [a.source_id for a in articles] == identifiers
+
+    assert (articles[0].pmid, articles[0].pmcid) == ("1", "PMC1")
+    # the only DOI of its batch, so matched to its record by position
+    doi = articles[-3]
+    assert (doi.doi, doi.pmid, doi.pmcid) == ("10.1234/abc", "1", "PMC1")
+    # unknown to the converter, so completed from Europe PMC
+    assert (articles[-2].pmid, articles[-2].doi) == ("9001", "10.1/epmc")
+    assert articles[-1] == ArticleIdentifier("not an id")
+
+    # two converter batches of PMIDs and one of DOIs, plus the one fallback
+    idconv_batches = []
+    fallbacks = []
+    for call in session.get.call_args_list:
+        params = call.kwargs["params"]
+        if call.args[0] == IDCONV_URL:
+            idconv_batches.append((params["idtype"], len(params["ids"].split(","))))
+        else:
+            fallbacks.append(params["query"])
+    assert idconv_batches == [("pmid", IDCONV_BATCH_SIZE), ("pmid", 2), ("doi", 1)]
+    assert fallbacks == ["ext_id:9001"]
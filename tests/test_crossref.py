@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import orjson
+import pytest
+import requests
+from fpmcp.crossref.utils import _get_fulltext_urls, get_fulltext_urls_from_crossref
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_WORK = {
+    "message": {
+        "link": [{"content-type": "application/pdf", "URL": "https://x.org/a.pdf"}],
+        "license": [{"URL": "https://creativecommons.org/licenses/by/4.0/"}],
+    }
+}
+
+
+def _response(status_code: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = orjson.dumps(_WORK) if status_code == 200 else b"{}"
+    return response
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> Iterator[Mock]:
+    session = Mock()
+    monkeypatch.setattr("fpmcp.crossref.utils.get_session", lambda: session)
+    _get_fulltext_urls.cache_clear()
+    yield session
+    _get_fulltext_urls.cache_clear()
+
+
+def test_lookups_cached_by_normalized_doi(session: Mock) -> None:
+    session.get.return_value = _response(200)
+    urls = get_fulltext_urls_from_crossref("10.1234/ABC")
+    assert urls["pdf_url"] == "https://x.org/a.pdf"
+
+    # callers get their own copy of the cached result
+    urls["licenses"].clear()
+    urls["pdf_url"] = None
+    again = get_fulltext_urls_from_crossref(" 10.1234/abc ")
+    assert again["pdf_url"] == "https://x.org/a.pdf"
+    assert again["licenses"] == ["https://creativecommons.org/licenses/by/4.0/"]
+    session.get.assert_called_once_with("https://api.crossref.org/works/10.1234/abc")
+
+
+def test_failed_lookups_not_cached(session: Mock) -> None:
+    session.get.side_effect = [_response(503), _response(200)]
+    assert get_fulltext_urls_from_crossref("10.1234/abc") == {}
+    assert get_fulltext_urls_from_crossref("10.1234/abc")["pdf_url"]
+    assert session.get.call_count == 2
@@ -1,12 +1,20 @@
-import sys
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 import pytest
-from fpmcp.europmc import get_fulltext_from_europmc
 from fpmcp.util import iter_tables
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+pytestmark = pytest.mark.network
 
-def test_fetch_full_text(pmid: str = "35468954"):
-    fulltext_xml = get_fulltext_from_europmc(pmid)
+
+def test_fetch_full_text(
+    europmc_xml: Callable[[str], str | None], pmid: str = "35468954"
+):
+    fulltext_xml = europmc_xml(pmid)
     assert fulltext_xml is not None
     assert "<article" in fulltext_xml
 
@@ -40,22 +48,21 @@ def test_fetch_full_text(pmid: str = "35468954"):
     ],
     ids=lambda x: x if isinstance(x, str) else x[0],
 )
-def test_parse_tables(pmid: str | tuple[str, list[str]]) -> None:
+def test_parse_tables(
+    europmc_xml: Callable[[str], str | None],
+    show: Callable[..., None],
+    pmid: str | tuple[str, list[str]],
+) -> None:
     expect = None
     if isinstance(pmid, tuple):
         pmid, expect = pmid
-    fulltext_xml = get_fulltext_from_europmc(pmid)
+    fulltext_xml = europmc_xml(pmid)
     assert fulltext_xml is not None
     tables = list(iter_tables(fulltext_xml))
     assert len(tables) > 0
 
-    if "-s" in sys.argv:
-        from rich.console import Console
-        from rich.markdown import Markdown
-
-        console = Console()
-        for table in tables:
-            console.print(Markdown(table))
+    for table in tables:
+        show(table, markdown=True)
 
     if expect is not None:
         t = tables[0]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from fpmcp.fpbase.query import (
+    _build_indexes,
+    dois,
+    get_protein_references,
+    pmids,
+    protein_article_ids,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_REFS = [
+    {
+        "doi": "10.1038/s41592-023-02085-6",
+        "pmid": "38036853",
+        "proteins": {"edges": [{"node": {"id": "1", "name": "Stay Gold"}}]},
+    },
+    {"doi": None, "pmid": "123", "proteins": {"edges": []}},
+]
+
+
+@pytest.fixture(autouse=True)
+def fake_references(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr("fpmcp.fpbase.query.get_references", lambda: _REFS)
+    _build_indexes.cache_clear()
+    yield
+    _build_indexes.cache_clear()
+
+
+def test_indexes() -> None:
+    stay_gold = {"id": "1", "name": "Stay Gold"}
+    assert pmids() == {"38036853": (stay_gold,), "123": ()}
+    assert dois() == {"10.1038/s41592-023-02085-6": (stay_gold,)}
+    refs = get_protein_references()
+    assert refs["stay gold"] == (
+        {"doi": "10.1038/s41592-023-02085-6", "pmid": "38036853"},
+    )
+    assert refs.get("unknown", ()) == ()
+    assert protein_article_ids() == {"staygold": ("10.1038/s41592-023-02085-6",)}
+
+
+def test_indexes_are_read_only() -> None:
+    ids = protein_article_ids()
+    with pytest.raises(TypeError):
+        ids["staygold"] = ()  # ty: ignore[invalid-assignment]
+    # the indexes are cached, so every caller sees the same entries
+    assert protein_article_ids()["staygold"] == ("10.1038/s41592-023-02085-6",)
@@ -2,15 +2,202 @@
 
 from __future__ import annotations
 
-import sys
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
 
-from fpmcp.fulltext import extract_tables, get_fulltext
+import pytest
+import requests
+from fpmcp.article_id import ArticleIdentifier
+from fpmcp.crossref.utils import _get_fulltext_urls
+from fpmcp.fulltext import (
+    FullTextResult,
+    _LRUCache,
+    _memoized,
+    _sniff_pdf,
+    clear_fulltext_cache,
+    extract_tables,
+    get_fulltext,
+    get_fulltext_sources,
+    probe_fulltext,
+)
+from fpmcp.unpaywall.utils import _get_unpaywall_data
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
 
-def test_get_fulltext_from_doi():
+
+def _offline_article() -> ArticleIdentifier:
+    """An article with a DOI and PMID, made without looking them up."""
+    article = ArticleIdentifier("")
+    article.doi, article.pmid = "10.1234/example", "12345"
+    return article
+
+
+@pytest.fixture
+def fake_sources(monkeypatch: pytest.MonkeyPatch) -> Iterator[dict[str, Mock]]:
+    """Replace the network calls of all sources: each one has the article."""
+    epmc_hit = SimpleNamespace(inEPMC="Y", pmcid="PMC1")
+    unpaywall_loc = {"url_for_pdf": "https://example.org/unpaywall.pdf"}
+    mocks = {
+        "_search": Mock(
+            return_value=SimpleNamespace(resultList=SimpleNamespace(result=[epmc_hit]))
+        ),
+        "_fulltext_xml": Mock(return_value=b"<article/>"),
+        "get_unpaywall_data": Mock(return_value={"best_oa_location": unpaywall_loc}),
+        "get_fulltext_urls_from_crossref": Mock(
+            return_value={"pdf_url": "https://example.org/crossref.pdf"}
+        ),
+        "_download_pdf": Mock(return_value=b"%PDF-1.7"),
+        "_is_pdf_url": Mock(return_value=True),
+    }
+    for name, mock in mocks.items():
+        monkeypatch.setattr(f"fpmcp.fulltext.{name}", mock)
+    clear_fulltext_cache()
+    yield mocks
+    clear_fulltext_cache()
+
+
+def test_xml_source_skips_pdf_downloads(fake_sources: dict[str, Mock]):
+    """Test that no PDF is downloaded or probed when Europe PMC has the XML."""
+    result = get_fulltext(_offline_article())
+    assert result is not None
+    assert (result.source, result.content) == ("europmc", b"<article/>")
+
+    clear_fulltext_cache()
+    info = probe_fulltext(_offline_article())
+    assert info is not None
+    assert info.source == "europmc"
+
+    fake_sources["_download_pdf"].assert_not_called()
+    fake_sources["_is_pdf_url"].assert_not_called()
+
+
+def test_pdf_sources_tried_in_order(fake_sources: dict[str, Mock]):
+    """Test that PDFs are only fetched once the preferred sources have failed."""
+    fake_sources["_search"].return_value.resultList.result = []
+    fake_sources["_download_pdf"].side_effect = [None, b"%PDF-1.7"]
+    result = get_fulltext(_offline_article())
+    assert result is not None
+    assert result.source == "crossref"
+    assert [c.args[0] for c in fake_sources["_download_pdf"].call_args_list] == [
+        "https://example.org/unpaywall.pdf",
+        "https://example.org/crossref.pdf",
+    ]
+
+    clear_fulltext_cache()
+    info = probe_fulltext(_offline_article())
+    assert info is not None
+    assert info.source == "unpaywall"
+    fake_sources["_is_pdf_url"].assert_called_once_with(
+        "https://example.org/unpaywall.pdf"
+    )
+
+
+def test_failed_lookups_not_repeated(monkeypatch: pytest.MonkeyPatch):
+    """Test that a source whose lookup 404s is skipped, not looked up again."""
+    not_found = requests.Response()
+    not_found.status_code = 404
+    sessions = {}
+    for module in ("unpaywall", "crossref"):
+        sessions[module] = session = Mock()
+        session.get.return_value = not_found
+        monkeypatch.setattr(f"fpmcp.{module}.utils.get_session", lambda s=session: s)
+    no_hits = SimpleNamespace(resultList=SimpleNamespace(result=[]))
+    monkeypatch.setattr("fpmcp.fulltext._search", Mock(return_value=no_hits))
+    download = Mock()
+    monkeypatch.setattr("fpmcp.fulltext._download_pdf", download)
+    monkeypatch.setattr("fpmcp.fulltext._is_pdf_url", download)
+
+    for find in (get_fulltext, probe_fulltext):
+        _get_unpaywall_data.cache_clear()
+        _get_fulltext_urls.cache_clear()
+        assert find(_offline_article()) is None
+        for module, session in sessions.items():
+            assert session.get.call_count == 1, f"{find.__name__}: {module}"
+            session.get.reset_mock()
+    download.assert_not_called()
+
+
+def test_sources_can_be_patched(fake_sources: dict[str, Mock]):
+    """Test that patching a source function replaces it in every lookup."""
+    result = FullTextResult(
+        "europmc", "xml", b"<patched/>", _offline_article(), "https://example.org"
+    )
+    with patch("fpmcp.fulltext._try_europmc", return_value=result) as try_europmc:
+        assert get_fulltext(_offline_article()) is result
+        sources = get_fulltext_sources(_offline_article())
+        assert sources[0]() is result
+    assert try_europmc.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("chunks", "is_pdf"),
+    [
+        ([b"%PDF-1.7\n", b"rest"], True),
+        ([b"%P", b"DF-1.4"], True),  # signature split across chunks
+        ([b"\xef\xbb\xbf%PDF-1.7\n"], True),  # UTF-8 BOM
+        ([b"\r\n" * 100, b"junk %PDF-1.5\n"], True),  # junk before the header
+        ([b"x" * 1020, b"%PDF-1.5"], False),  # header beyond the first 1KB
+        ([b"<html>paywall</html>"], False),
+        ([], False),
+    ],
+)
+def test_sniff_pdf(chunks: list[bytes], is_pdf: bool):
+    """Test PDF detection from the first bytes of a body."""
+    assert (_sniff_pdf(iter(chunks)) is not None) == is_pdf
+
+
+def test_sniff_pdf_leaves_rest_of_body():
+    """Test that only the chunks needed to detect a PDF are consumed."""
+    chunks = iter([b"%PDF-1.7\n", b"page 1", b"page 2"])
+    content = _sniff_pdf(chunks)
+    assert content == b"%PDF-1.7\n"
+    assert list(chunks) == [b"page 1", b"page 2"]
+
+
+def test_lru_cache():
+    """Test that the least recently used entry is evicted."""
+    cache = _LRUCache[int](maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "a" is now the most recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    cache.put("a", 4)  # replacing a value doesn't grow the cache
+    assert len(cache._data) == 2
+    assert cache.get("a") == 4
+
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_memoized():
+    """Test that values are extracted once per result, keyed on identity."""
+    cache = _LRUCache[tuple[FullTextResult, str]](maxsize=2)
+    extract = Mock(side_effect=lambda fulltext: fulltext.url)
+    url = "https://example.org/article"
+    first, second = (
+        FullTextResult("europmc", "xml", b"<article/>", _offline_article(), url)
+        for _ in range(2)
+    )
+
+    assert _memoized(cache, first, extract) == url
+    assert _memoized(cache, first, extract) == url
+    assert extract.call_count == 1
+    # an equal but distinct result is extracted again
+    assert second == first
+    assert _memoized(cache, second, extract) == url
+    assert extract.call_count == 2
+
+
+@pytest.mark.network
+def test_get_fulltext_from_doi(example_fulltext: FullTextResult | None):
     """Test fetching fulltext from a DOI."""
     # This paper should have full text in Europe PMC
-    result = get_fulltext("10.1038/s41592-023-02085-6")
+    result = example_fulltext
     assert result is not None
     assert result.source in ("europmc", "unpaywall", "crossref")
     assert result.format in ("xml", "pdf")
@@ -20,12 +207,15 @@ def test_get_fulltext_from_doi():
     assert result.article_id.doi == "10.1038/s41592-023-02085-6"
 
 
-def test_extract_tables_from_doi():
+@pytest.mark.network
+def test_extract_tables_from_doi(
+    example_fulltext: FullTextResult | None, show: Callable[..., None]
+):
     """Test extracting tables from the example DOI.
 
     This paper (PMID 38036853) is known to have useful tables.
     """
-    result = get_fulltext("10.1038/s41592-023-02085-6")
+    result = example_fulltext
     assert result is not None
 
     tables = extract_tables(result)
@@ -36,18 +226,14 @@ def test_extract_tables_from_doi():
     table_text = "\n".join(tables)
     assert len(table_text) > 100  # Should have substantial content
 
-    if "-s" in sys.argv:
-        from rich.console import Console
-        from rich.markdown import Markdown
-
-        console = Console()
-        console.print(f"\n[bold]Source: {result.source} ({result.format})[/bold]\n")
-        for idx, table in enumerate(tables, 1):
-            console.print(f"[bold cyan]Table {idx}:[/bold cyan]")
-            console.print(Markdown(table))
-            console.print()
+    show(f"\n[bold]Source: {result.source} ({result.format})[/bold]\n")
+    for idx, table in enumerate(tables, 1):
+        show(f"[bold cyan]Table {idx}:[/bold cyan]")
+        show(table, markdown=True)
+        show()
 
 
+@pytest.mark.network
 def test_get_fulltext_from_pmid():
     """Test fetching fulltext from a PMID."""
     result = get_fulltext("38036853")  # Same paper as the DOI above
@@ -56,13 +242,33 @@ def test_get_fulltext_from_pmid():
     assert result.article_id.doi == "10.1038/s41592-023-02085-6"
 
 
-def test_compare_xml_vs_pdf_tables():
+@pytest.mark.network
+def test_probe_fulltext_matches_get_fulltext(example_fulltext: FullTextResult | None):
+    """Test that probing reports the source get_fulltext would use."""
+    info = probe_fulltext("10.1038/s41592-023-02085-6")
+    assert info is not None
+    assert info.article_id.doi == "10.1038/s41592-023-02085-6"
+    assert info.url.startswith("http")
+
+    result = example_fulltext
+    assert result is not None
+    assert (info.source, info.format, info.url) == (
+        result.source,
+        result.format,
+        result.url,
+    )
+
+
+@pytest.mark.network
+def test_compare_xml_vs_pdf_tables(
+    example_fulltext: FullTextResult | None, show: Callable[..., None]
+):
     """Compare table extraction quality between XML and PDF sources.
 
     This test will help verify that our PDF fallback produces similar
     quality results to the XML source.
     """
-    result = get_fulltext("10.1038/s41592-023-02085-6")
+    result = example_fulltext
     assert result is not None
 
     tables = extract_tables(result)
@@ -75,11 +281,7 @@ def test_compare_xml_vs_pdf_tables():
         # Should have header separator
         assert "---" in table or "Table" in table
 
-    if "-s" in sys.argv:
-        from rich.console import Console
-
-        console = Console()
-        msg = f"✓ Extracted {len(tables)} tables from {result.source} ({result.format})"
-        console.print(f"\n[bold green]{msg}[/bold green]")
-        content_type = "bytes" if result.format == "pdf" else "chars"
-        console.print(f"Total content length: {len(result.content):,} {content_type}")
+    msg = f"✓ Extracted {len(tables)} tables from {result.source} ({result.format})"
+    show(f"\n[bold green]{msg}[/bold green]")
+    content_type = "bytes" if result.format == "pdf" else "chars"
+    show(f"Total content length: {len(result.content):,} {content_type}")
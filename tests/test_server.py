@@ -1,127 +1,168 @@
+import re
+from unittest.mock import patch
+
 import pytest
 from fastmcp.client import Client
 from fastmcp.client.transports import FastMCPTransport
+from fpmcp.article_id import ArticleIdentifier
+from fpmcp.fulltext import FullTextResult
 from fpmcp.server import mcp
 
+# a single table row (line) mentioning the protein and the expected value
+_STAYGOLD_QY_RE = re.compile(
+    r"^(?=.*stay)(?=.*gold).*0\.93", re.IGNORECASE | re.MULTILINE
+)
+_MEGFP_ABS_RE = re.compile(r"^(?=.*megfp).*488", re.IGNORECASE | re.MULTILINE)
+
+_TABLE_XML = b"""<article><body><table-wrap>
+<label>Table 1</label><caption><p>Properties</p></caption>
+<table>
+<thead><tr><th>Protein</th><th>QY</th></tr></thead>
+<tbody><tr><td>StayGold</td><td>0.93</td></tr></tbody>
+</table>
+</table-wrap></body></article>"""
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def main_mcp_client():
     async with Client(transport=mcp) as mcp_client:
         yield mcp_client
 
 
+@pytest.fixture(scope="session")
+async def example_tables(main_mcp_client: Client[FastMCPTransport]) -> str:
+    """Tables of the StayGold paper, fetched once for the tests that read them."""
+    result = await main_mcp_client.call_tool(
+        "get_article_tables", {"article_id": "10.1038/s41592-023-02085-6"}
+    )
+    return result.content[0].text
+
+
 async def test_list_tools(main_mcp_client: Client[FastMCPTransport]):
     list_tools = await main_mcp_client.list_tools()
     assert len(list_tools) >= 5
     tool_names = [tool.name for tool in list_tools]
     assert "get_article_tables" in tool_names
+    assert "get_articles_tables" in tool_names
     assert "get_article_text" in tool_names
     assert "get_article_info" in tool_names
+    assert "get_articles_info" in tool_names
     assert "get_protein_article_ids" in tool_names
     assert "search_article_text" in tool_names
 
 
-async def test_get_article_tables(main_mcp_client: Client[FastMCPTransport]):
+def _fake_fulltext(article_id: str) -> FullTextResult | None:
+    """Stand-in for get_fulltext: "xml" and "pdf" articles exist, others don't."""
+    url = f"https://example.org/{article_id}"
+    if article_id == "xml":
+        return FullTextResult("europmc", "xml", _TABLE_XML, ArticleIdentifier(""), url)
+    if article_id == "pdf":
+        return FullTextResult(
+            "unpaywall", "pdf", b"%PDF-1.7\n", ArticleIdentifier(""), url
+        )
+    return None
+
+
+async def test_article_tables_offline(main_mcp_client: Client[FastMCPTransport]):
+    """Test the table tools on fake full-text, including a PDF-only article."""
+    with patch("fpmcp.server.get_fulltext", _fake_fulltext):
+        result = await main_mcp_client.call_tool(
+            "get_article_tables", {"article_id": "xml"}
+        )
+        assert "| StayGold | 0.93 |" in result.data[0]
+
+        result = await main_mcp_client.call_tool(
+            "get_articles_tables", {"article_ids": ["xml", "pdf", "missing", "xml"]}
+        )
+    tables = result.structured_content
+    assert tables is not None
+    assert list(tables) == ["xml", "pdf", "missing"]
+    assert tables["xml"][0].startswith("**Table 1: Properties**")
+    # a PDF whose tables can't be extracted doesn't fail the other articles
+    assert tables["pdf"] == tables["missing"] == []
+
+
+@pytest.mark.network
+async def test_get_article_tables(example_tables: str):
     """Test that we can fetch tables from an article."""
-    result = await main_mcp_client.call_tool(
-        "get_article_tables", {"article_id": "10.1038/s41592-023-02085-6"}
-    )
-    tables = result.content[0].text
+    tables = example_tables
     assert isinstance(tables, str)
     assert len(tables) > 0
     # Should contain table data
     assert "StayGold" in tables or "staygold" in tables.lower()
 
 
-async def test_quantum_yield_of_staygold(main_mcp_client: Client[FastMCPTransport]):
-    """Test finding the quantum yield of StayGold (should be 0.93).
-
-    This test simulates the query:
-    "What is the quantum yield of staygold in 10.1038/s41592-023-02085-6"
-
-    The correct answer is 0.93 (found in Table 1 of the paper).
-    """
-    # Get tables from the article
+@pytest.mark.network
+async def test_get_articles_tables(main_mcp_client: Client[FastMCPTransport]):
+    """Test fetching tables from several articles at once."""
+    doi, pmid = "10.1038/s41592-023-02085-6", "38036853"  # the same paper
     result = await main_mcp_client.call_tool(
-        "get_article_tables", {"article_id": "10.1038/s41592-023-02085-6"}
+        "get_articles_tables", {"article_ids": [doi, pmid]}
     )
-    tables_str = result.content[0].text
-
-    # Parse tables - should be multiple tables separated by markdown
-    assert "StayGold" in tables_str or "staygold" in tables_str.lower()
-
-    # Find the quantum yield value for StayGold
-    # The table has a row for StayGold with QY (quantum yield) value of 0.93
-    # Let's search for lines containing "StayGold" and look for the QY value
-
-    lines = tables_str.split("\n")
-    staygold_lines = [
-        line for line in lines if "stay" in line.lower() and "gold" in line.lower()
-    ]
-
-    # Should find at least one line with StayGold
-    assert len(staygold_lines) > 0
-
-    # Look for 0.93 in the StayGold rows
-    # The format should have the protein name and then columns with values
-    found_qy = False
-    for line in staygold_lines:
-        # Look for 0.93 in this line (the quantum yield)
-        if "0.93" in line:
-            found_qy = True
-            break
-
-    assert found_qy, f"Could not find QY=0.93 for StayGold in: {staygold_lines}"
-
-
-async def test_absorption_maximum_of_megfp(main_mcp_client: Client[FastMCPTransport]):
-    """Test finding the absorption maximum of mEGFP (should be 488).
+    tables = result.structured_content
+    assert tables is not None
+    assert set(tables) == {doi, pmid}
+    assert tables[doi]
+    assert tables[doi] == tables[pmid]
+
+
+@pytest.mark.network
+@pytest.mark.parametrize(
+    ("protein", "row_re", "value"),
+    [
+        ("StayGold", _STAYGOLD_QY_RE, "QY=0.93"),
+        ("mEGFP", _MEGFP_ABS_RE, "absorption maximum=488"),
+    ],
+    ids=["quantum_yield_of_staygold", "absorption_maximum_of_megfp"],
+)
+async def test_table_value(
+    example_tables: str, protein: str, row_re: re.Pattern[str], value: str
+):
+    """Test finding a protein property in the tables of the StayGold paper.
 
-    This test simulates the query:
-    "What is the absorption maximum of mEGFP in 10.1038/s41592-023-02085-6"
+    These simulate queries like:
+    "What is the quantum yield of staygold in 10.1038/s41592-023-02085-6"
 
-    The correct answer is 488 nm (found in Table 1 of the paper).
+    The correct answers (QY of StayGold is 0.93, absorption maximum of mEGFP is
+    488 nm) are both found in Table 1 of the paper.
     """
-    # Get tables from the article
-    result = await main_mcp_client.call_tool(
-        "get_article_tables", {"article_id": "10.1038/s41592-023-02085-6"}
-    )
-    tables_str = result.content[0].text
-
-    # Find the absorption maximum value for mEGFP
-    lines = tables_str.split("\n")
-    megfp_lines = [line for line in lines if "mEGFP" in line or "megfp" in line.lower()]
-
-    # Should find at least one line with mEGFP
-    assert len(megfp_lines) > 0, "Could not find mEGFP in tables"
-
-    # Look for 488 in the mEGFP rows (absorption maximum)
-    found_abs_max = False
-    for line in megfp_lines:
-        if "488" in line:
-            found_abs_max = True
-            break
-
-    assert found_abs_max, (
-        f"Could not find absorption maximum=488 for mEGFP in: {megfp_lines}"
-    )
+    assert protein.lower() in example_tables.lower(), f"Could not find {protein}"
+    # the value should be in the same table row as the protein name
+    assert row_re.search(example_tables), f"Could not find {value} for {protein}"
 
 
+@pytest.mark.network
 async def test_get_article_info(main_mcp_client: Client[FastMCPTransport]):
     """Test getting article metadata."""
     result = await main_mcp_client.call_tool(
         "get_article_info", {"article_id": "10.1038/s41592-023-02085-6"}
     )
     info_str = result.content[0].text
-    assert "source" in info_str.lower()
-    assert "doi" in info_str.lower()
+    info_lower = info_str.lower()
+    assert "source" in info_lower
+    assert "doi" in info_lower
     # Should contain the DOI we requested
     assert "10.1038/s41592-023-02085-6" in info_str
     # Should contain a URL field with a valid URL
-    assert "url" in info_str.lower()
-    assert "http" in info_str.lower()
+    assert "url" in info_lower
+    assert "http" in info_lower
+
+
+@pytest.mark.network
+async def test_get_articles_info(main_mcp_client: Client[FastMCPTransport]):
+    """Test getting metadata for several articles at once."""
+    doi, pmid = "10.1038/s41592-023-02085-6", "38036853"  # the same paper
+    result = await main_mcp_client.call_tool(
+        "get_articles_info", {"article_ids": [doi, pmid]}
+    )
+    infos = result.structured_content
+    assert infos is not None
+    assert set(infos) == {doi, pmid}
+    assert infos[doi]["doi"] == infos[pmid]["doi"] == doi
+    assert infos[doi]["url"].startswith("http")
 
 
+@pytest.mark.network
 async def test_get_protein_article_ids(main_mcp_client: Client[FastMCPTransport]):
     """Test getting article IDs for a protein."""
     result = await main_mcp_client.call_tool(
@@ -135,6 +176,7 @@ async def test_get_protein_article_ids(main_mcp_client: Client[FastMCPTransport]
     assert "10.1038" in ids_str or "PMC" in ids_str or any(c.isdigit() for c in ids_str)
 
 
+@pytest.mark.network
 async def test_search_article_text(main_mcp_client: Client[FastMCPTransport]):
     """Test searching article text for patterns."""
     # Search for oligomerization mentions in the StayGold paper
@@ -150,17 +192,19 @@ async def test_search_article_text(main_mcp_client: Client[FastMCPTransport]):
     assert len(matches_str) > 0
 
     # Should find mentions of dimerization or oligomerization
+    matches_lower = matches_str.lower()
     assert (
-        "monomer" in matches_str.lower()
-        or "dimer" in matches_str.lower()
-        or "oligomer" in matches_str.lower()
+        "monomer" in matches_lower
+        or "dimer" in matches_lower
+        or "oligomer" in matches_lower
     )
 
     # Should contain context around the match
-    assert "text" in matches_str.lower()
-    assert "match" in matches_str.lower()
+    assert "text" in matches_lower
+    assert "match" in matches_lower
 
 
+@pytest.mark.network
 async def test_search_article_text_quantum_yield(
     main_mcp_client: Client[FastMCPTransport],
 ):
@@ -175,4 +219,5 @@ async def test_search_article_text_quantum_yield(
     assert len(matches_str) > 0
 
     # Should find quantum yield mentions
-    assert "quantum" in matches_str.lower() and "yield" in matches_str.lower()
+    matches_lower = matches_str.lower()
+    assert "quantum" in matches_lower and "yield" in matches_lower
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import orjson
+import pytest
+import requests
+from fpmcp.unpaywall.utils import EMAIL, _get_unpaywall_data, get_unpaywall_data
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_LOCATION = {"url_for_pdf": "https://x.org/a.pdf", "host_type": "repository"}
+_DOI_DATA = {"is_oa": True, "best_oa_location": _LOCATION, "oa_locations": [_LOCATION]}
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> Iterator[Mock]:
+    session = Mock()
+    response = requests.Response()
+    response.status_code = 200
+    response._content = orjson.dumps(_DOI_DATA)
+    session.get.return_value = response
+    monkeypatch.setattr("fpmcp.unpaywall.utils.get_session", lambda: session)
+    _get_unpaywall_data.cache_clear()
+    yield session
+    _get_unpaywall_data.cache_clear()
+
+
+def test_lookups_cached_by_normalized_doi(session: Mock) -> None:
+    data = get_unpaywall_data("10.1234/ABC")
+    assert data == _DOI_DATA
+
+    # callers get their own copy of the cached result, nested values included
+    data["best_oa_location"]["url_for_pdf"] = None
+    data["oa_locations"].clear()
+    data["is_oa"] = False
+    assert get_unpaywall_data(" 10.1234/abc ") == _DOI_DATA
+    session.get.assert_called_once_with(
+        "https://api.unpaywall.org/v2/10.1234/abc", params={"email": EMAIL}
+    )
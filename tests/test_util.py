@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+from fpmcp.util import _get_cell_text, _parse_thead, iter_tables, parse_xml
+
+_JATS = """<?xml version="1.0" encoding="UTF-8"?>
+<article><body><p>Introduction</p>
+<table-wrap id="t1">
+<label>Table 1</label><caption><p>Spectral properties</p></caption>
+<table>
+<thead>
+<tr><th rowspan="2">Protein</th><th colspan="2">λ (nm)</th><th rowspan="2">QY</th></tr>
+<tr><th>ex</th><th>em</th></tr>
+</thead>
+<tbody>
+<tr>
+<td>StayGold<sup>a</sup></td><td>496</td><td>504</td>
+<td>0.93<sup><xref ref-type="bibr" rid="r1">12</xref></sup></td>
+</tr>
+<tr><td>mEGFP</td><td>488</td><td>507</td></tr>
+</tbody>
+</table>
+<table-wrap-foot><p>aMeasured at pH 7.4; bEmission maximum</p></table-wrap-foot>
+</table-wrap>
+<table-wrap><label>Table 2</label><caption><p>Not a table</p></caption></table-wrap>
+<table-wrap>
+<caption><p>Units</p></caption>
+<alternatives><graphic/><table><tbody>
+<tr><td>ε (M<sup>−1</sup> cm<sup>−1</sup>)</td><td>k<sub>cat</sub></td></tr>
+</tbody></table></alternatives>
+</table-wrap>
+</body></article>"""  # noqa: RUF001
+
+
+@pytest.mark.parametrize("xml", [_JATS, _JATS.encode()], ids=["str", "bytes"])
+def test_iter_tables(xml: str | bytes) -> None:
+    tables = list(iter_tables(xml))
+    # the table-wrap without a <table> is skipped
+    assert len(tables) == 2
+
+    assert tables[0].splitlines() == [
+        "**Table 1: Spectral properties**",
+        "",
+        "| Protein | λ (nm) > ex | λ (nm) > em | QY |",
+        "| --- | --- | --- | --- |",
+        "| StayGold a | 496 | 504 | 0.93 |",
+        "| mEGFP | 488 | 507 |  |",
+        "",
+        "**Legend:**",
+        "- a: Measured at pH 7.4",
+        "- b: Emission maximum",
+    ]
+    # a <table> inside <alternatives>, with no header
+    assert tables[1].splitlines() == [
+        "**Units**",
+        "",
+        "| ε (M^−1 cm^−1) | k_cat |",  # noqa: RUF001
+    ]
+
+
+@pytest.mark.parametrize(
+    ("cell", "expect"),
+    [
+        ("<td/>", ""),
+        ("<td>  spaced \n\t out  </td>", "spaced out"),
+        ("<td>6.1<sup>b</sup></td>", "6.1 b"),
+        ("<td>cm<sup>-1</sup></td>", "cm^-1"),
+        ("<td>τ<sub>1/2</sub></td>", "τ_1/2"),
+        ("<td>0.93<sup><xref rid='r1'>12</xref></sup></td>", "0.93"),
+        ("<td>45 <xref rid='r2'>3</xref> min</td>", "45 min"),
+        # nested elements are stripped before they're joined
+        ("<td><bold> mNeon<italic> Green </italic></bold>2</td>", "mNeonGreen2"),
+    ],
+)
+def test_get_cell_text(cell: str, expect: str) -> None:
+    assert _get_cell_text(parse_xml(cell)) == expect
+
+
+@pytest.mark.parametrize(
+    ("thead", "expect"),
+    [
+        ("<thead/>", []),
+        ("<thead><tr><th>A</th><th>B</th></tr></thead>", ["A", "B"]),
+        (
+            "<thead><tr><th rowspan='2'>A</th><th colspan='2'>B</th></tr>"
+            "<tr><th>b1</th><th>b2</th></tr></thead>",
+            ["A", "B > b1", "B > b2"],
+        ),
+        (
+            # an empty subheader is taken from the one on its left
+            "<thead><tr><th colspan='2'>A</th><th>B</th></tr>"
+            "<tr><th>a1</th><th/><th>b1</th></tr></thead>",
+            ["A > a1", "A > a1", "B > b1"],
+        ),
+    ],
+)
+def test_parse_thead(thead: str, expect: list[str]) -> None:
+    assert _parse_thead(parse_xml(thead)) == expect